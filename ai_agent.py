@@ -1,8 +1,289 @@
 """AI Agent for competitive maze navigation"""
 
 import pygame
+import numpy as np
+from array import array
+from collections import deque
 from heapq import heappush, heappop
-from maze_generation import get_terrain_cost, is_passable, TERRAIN_GOAL, TERRAIN_CHECKPOINT, TERRAIN_GRASS
+from maze_generation import (
+    get_terrain_cost, is_passable, TERRAIN_COSTS, COST_TABLE, PASSABLE_TABLE,
+    TERRAIN_GOAL, TERRAIN_CHECKPOINT, TERRAIN_GRASS
+)
+
+# Numba is optional - when installed, the grid A* kernel below is JIT-compiled
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# The Cython extension (see astar_core.pyx / setup.py) is an alternative
+# compiled backend; when built it takes precedence over the Numba kernel
+try:
+    import astar_core
+except ImportError:
+    astar_core = None
+
+# Neighbor offsets for the 4-connected grid, shared by every search loop
+DIRECTIONS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+
+# Large finite stand-in for infinity so costs fit in int32 arrays
+_INF = 2 ** 30
+
+# Sentinel byte for tiles not yet revealed in the flat known-terrain buffer
+_UNKNOWN = 255
+
+# Precomputed boolean diamond masks keyed by vision range; entry [dy, dx]
+# is True when |dy| + |dx| <= range
+_DIAMOND_MASKS = {}
+
+
+def _diamond_mask(vision_range):
+    """Get (building on first use) the diamond mask for a vision range"""
+    mask = _DIAMOND_MASKS.get(vision_range)
+    if mask is None:
+        offsets = np.abs(np.arange(-vision_range, vision_range + 1))
+        mask = np.add.outer(offsets, offsets) <= vision_range
+        _DIAMOND_MASKS[vision_range] = mask
+    return mask
+
+
+def _heap_push(heap, key):
+    """Sift a packed int64 key up an array('q')-backed binary min-heap
+
+    Unlike heapq over tuples, the keys stay unboxed in a contiguous
+    C-typed buffer and comparisons are plain int64 compares.
+    """
+    heap.append(key)
+    i = len(heap) - 1
+    while i > 0:
+        up = (i - 1) // 2
+        if heap[up] > key:
+            heap[i] = heap[up]
+            i = up
+        else:
+            break
+    heap[i] = key
+
+
+def _heap_pop(heap):
+    """Pop the smallest packed key, sifting the last entry down"""
+    last = heap.pop()
+    if not heap:
+        return last
+    smallest = heap[0]
+    n = len(heap)
+    i = 0
+    while True:
+        child = 2 * i + 1
+        if child >= n:
+            break
+        right = child + 1
+        if right < n and heap[right] < heap[child]:
+            child = right
+        if heap[child] < last:
+            heap[i] = heap[child]
+            i = child
+        else:
+            break
+    heap[i] = last
+    return smallest
+
+
+# Shared goal-rooted routing field: one Dijkstra flood from the goal serves
+# every agent on the same maze, so four agents cost one search instead of
+# four. Holding the maze reference keeps identity checks safe.
+_GOAL_FIELD_CACHE = {'maze': None, 'goal': None, 'dist': None, 'step': None}
+
+
+def _goal_distance_field(maze, goal_x, goal_y):
+    """Distance and next-step arrays routing every tile toward the goal
+
+    Runs a single Dijkstra flood from the goal (the grid is symmetric, so
+    the reverse search gives forward distances) and caches the result per
+    (maze, goal). dist[pos] is the cheapest cost from that tile to the
+    goal; step[pos] is the packed next tile along that route.
+    """
+    cache = _GOAL_FIELD_CACHE
+    if cache['maze'] is maze and cache['goal'] == (goal_x, goal_y):
+        return cache['dist'], cache['step']
+
+    height = len(maze)
+    width = len(maze[0])
+    goal_pos = goal_y * width + goal_x
+
+    dist = np.full(height * width, _INF, dtype=np.int32)
+    step = np.full(height * width, -1, dtype=np.int32)
+    dist[goal_pos] = 0
+
+    heap = array('q', [goal_pos])  # key = (dist << 32) | pos
+    push = _heap_push
+    pop = _heap_pop
+    cost_table = COST_TABLE
+    passable_table = PASSABLE_TABLE
+
+    while heap:
+        key = pop(heap)
+        d = key >> 32
+        pos = key & 0xFFFFFFFF
+        if d > dist[pos]:
+            continue
+        y, x = divmod(pos, width)
+
+        # A forward step from any neighbor onto this tile pays this tile's
+        # terrain cost, so every reverse relaxation out of it shares it
+        move_cost = cost_table[maze[y][x]]
+        for dx, dy in DIRECTIONS:
+            next_x = x + dx
+            next_y = y + dy
+            if not (0 <= next_y < height and 0 <= next_x < width):
+                continue
+            if not passable_table[maze[next_y][next_x]]:
+                continue
+            next_pos = next_y * width + next_x
+            new_dist = d + move_cost
+            if new_dist < dist[next_pos]:
+                dist[next_pos] = new_dist
+                step[next_pos] = pos
+                push(heap, (new_dist << 32) | next_pos)
+
+    cache['maze'] = maze
+    cache['goal'] = (goal_x, goal_y)
+    cache['dist'] = dist
+    cache['step'] = step
+    return dist, step
+
+
+# Terrain costs indexed by terrain id (impassable terrain maps to _INF)
+_COST_LUT = np.array(
+    [_INF if TERRAIN_COSTS.get(t, 1) == float('inf') else TERRAIN_COSTS.get(t, 1)
+     for t in range(256)],
+    dtype=np.int32
+)
+
+
+def _astar_grid(maze, sx, sy, gx, gy, cost_lut):
+    """A* over a uint8 terrain grid (JIT-compiled when numba is installed)
+
+    Positions are packed as y * width + x so all state lives in flat
+    preallocated arrays instead of dicts and tuples.
+
+    Returns a 1D int32 array of packed positions from the tile after the
+    start up to the goal, or an empty array if the goal is unreachable.
+    """
+    height, width = maze.shape
+    size = height * width
+    flat = maze.ravel()
+    start = sy * width + sx
+    goal = gy * width + gx
+
+    g_score = np.full(size, _INF, dtype=np.int32)
+    parent = np.full(size, -1, dtype=np.int32)
+    g_score[start] = 0
+
+    # Binary min-heap of (f_score << 32) | position keys packed into one
+    # flat int64 array; comparing keys orders by f-score first and breaks
+    # ties by position, keeping the whole heap cache-resident
+    cap = size
+    heap = np.empty(cap, dtype=np.int64)
+    heap[0] = (np.int64(abs(sx - gx) + abs(sy - gy)) << 32) | start
+    heap_len = 1
+
+    found = False
+    while heap_len > 0:
+        key = heap[0]
+
+        # Pop the root: move the last entry up and sift it down
+        heap_len -= 1
+        last = heap[heap_len]
+        i = 0
+        while True:
+            child = 2 * i + 1
+            if child >= heap_len:
+                break
+            right = child + 1
+            if right < heap_len and heap[right] < heap[child]:
+                child = right
+            if heap[child] < last:
+                heap[i] = heap[child]
+                i = child
+            else:
+                break
+        if heap_len > 0:
+            heap[i] = last
+
+        pos = key & 0xFFFFFFFF
+        x = pos % width
+        y = pos // width
+
+        # Recover g from the packed f-score and skip stale entries that
+        # were superseded by a cheaper relaxation
+        g = (key >> 32) - (abs(x - gx) + abs(y - gy))
+        if g > g_score[pos]:
+            continue
+
+        if pos == goal:
+            found = True
+            break
+        for d in range(4):
+            if d == 0:
+                nx, ny = x, y + 1
+            elif d == 1:
+                nx, ny = x + 1, y
+            elif d == 2:
+                nx, ny = x, y - 1
+            else:
+                nx, ny = x - 1, y
+
+            if nx < 0 or nx >= width or ny < 0 or ny >= height:
+                continue
+
+            next_pos = ny * width + nx
+            move_cost = cost_lut[flat[next_pos]]
+            if move_cost >= _INF:
+                continue
+
+            new_cost = g + move_cost
+            if new_cost < g_score[next_pos]:
+                g_score[next_pos] = new_cost
+                parent[next_pos] = pos
+                new_key = (np.int64(new_cost + abs(nx - gx) + abs(ny - gy)) << 32) | next_pos
+
+                # Push: grow the heap if full, then sift up
+                if heap_len == cap:
+                    cap *= 2
+                    grown = np.empty(cap, dtype=np.int64)
+                    grown[:heap_len] = heap
+                    heap = grown
+                i = heap_len
+                heap_len += 1
+                while i > 0:
+                    up = (i - 1) // 2
+                    if heap[up] > new_key:
+                        heap[i] = heap[up]
+                        i = up
+                    else:
+                        break
+                heap[i] = new_key
+
+    if not found:
+        return np.empty(0, dtype=np.int32)
+
+    # Walk the parent array backward to build the path (excluding start)
+    length = 0
+    node = goal
+    while node != start:
+        length += 1
+        node = parent[node]
+    path = np.empty(length, dtype=np.int32)
+    node = goal
+    for i in range(length - 1, -1, -1):
+        path[i] = node
+        node = parent[node]
+    return path
+
+
+if njit is not None:
+    _astar_grid = njit(cache=True)(_astar_grid)
 
 
 class AIAgent:
@@ -15,16 +296,30 @@ class AIAgent:
         self.name = name
         self.color = color
         self.total_cost = 0
-        self.path = []  # Current path to goal
+        self.path = deque()  # Current path to goal (popped from the left as moves are made)
         self.finished = False
         self.moves = 0
         self.explored_tiles = set()  # Tiles the AI has seen (for fog of war)
         self.known_maze = {}  # Stores terrain info for explored tiles (x, y) -> terrain_type
         self.energy_limit = energy_limit  # Maximum energy allowed (None = unlimited)
         self.out_of_energy = False  # Flag for energy depletion
+        self.path_valid = False  # Whether self.path still matches the world
         self.checkpoints_collected = 0  # Number of checkpoints collected (for multi-goal mode)
-        self.remaining_checkpoints = []  # List of checkpoint positions to visit
+        self.remaining_checkpoints = set()  # Checkpoint positions left to visit
         self.exploration_cost = 0  # Total exploration cost (for multi-goal mode)
+        self._maze_ref = None  # Maze the cached uint8 array was built from
+        self._maze_np = None  # Cached uint8 copy of the maze for the grid kernel
+        self._goal_cache = None  # Cached (x, y) of the goal tile
+        self._goal_maze_ref = None  # Maze the cached goal was found in
+        self._checkpoint_tour = None  # Planned checkpoint visiting order
+        self._tour_maze_ref = None  # Maze the tour was planned for
+        self._explored_mask = None  # Boolean per-tile explored array (fog of war)
+        self._known_flat = None  # Flat known-terrain bytes, _UNKNOWN when hidden
+        self._vision_maze_ref = None  # Maze the explored mask belongs to
+        self._maze_flat = None  # Flat bytes copy of the maze for the Python A*
+        self._maze_flat_ref = None  # Maze the flat copy was built from
+        self._uniform_cost = False  # Whether every passable tile costs 1
+        self._uniform_maze_ref = None  # Maze the uniform-cost check ran on
 
     def update_vision(self, maze, vision_range=5, fog_of_war=False):
         """Update AI's knowledge of the maze based on current position
@@ -38,18 +333,59 @@ class AIAgent:
             # If no fog of war, AI knows everything
             return
 
-        # Update explored tiles and known maze within vision range
-        for dy in range(-vision_range, vision_range + 1):
-            for dx in range(-vision_range, vision_range + 1):
-                tile_x = self.tile_x + dx
-                tile_y = self.tile_y + dy
+        height = len(maze)
+        width = len(maze[0])
 
-                # Check bounds
-                if 0 <= tile_x < len(maze[0]) and 0 <= tile_y < len(maze):
-                    # Use Manhattan distance for vision
-                    if abs(dx) + abs(dy) <= vision_range:
-                        self.explored_tiles.add((tile_x, tile_y))
-                        self.known_maze[(tile_x, tile_y)] = maze[tile_y][tile_x]
+        # Reset the explored mask and flat known-terrain buffer when the
+        # maze object is replaced
+        if self._vision_maze_ref is not maze:
+            self._explored_mask = np.zeros((height, width), dtype=bool)
+            self._known_flat = bytearray([_UNKNOWN]) * (height * width)
+            self._vision_maze_ref = maze
+
+        # Clip the vision window to the maze bounds and line up the matching
+        # slice of the precomputed diamond mask
+        x0 = max(0, self.tile_x - vision_range)
+        x1 = min(width, self.tile_x + vision_range + 1)
+        y0 = max(0, self.tile_y - vision_range)
+        y1 = min(height, self.tile_y + vision_range + 1)
+        mx0 = x0 - (self.tile_x - vision_range)
+        my0 = y0 - (self.tile_y - vision_range)
+        diamond = _diamond_mask(vision_range)
+        visible = diamond[my0:my0 + (y1 - y0), mx0:mx0 + (x1 - x0)]
+
+        # Only tiles entering vision for the first time need Python-level
+        # work; typically that is a thin frontier, not the whole diamond
+        window = self._explored_mask[y0:y1, x0:x1]
+        new_cells = visible & ~window
+        if not new_cells.any():
+            return
+        window |= visible
+
+        explored_tiles = self.explored_tiles
+        known_maze = self.known_maze
+        known_flat = self._known_flat
+        new_tiles = []
+        for dy, dx in np.argwhere(new_cells):
+            tile_x = x0 + int(dx)
+            tile_y = y0 + int(dy)
+            explored_tiles.add((tile_x, tile_y))
+            known_maze[(tile_x, tile_y)] = maze[tile_y][tile_x]
+            known_flat[tile_y * width + tile_x] = maze[tile_y][tile_x]
+            new_tiles.append((tile_x, tile_y))
+
+        # A newly revealed cheap tile on or next to the planned path may open
+        # a better route, so flag the plan for recalculation
+        if self.path_valid and self.path:
+            path_tiles = set(self.path)
+            for tile_x, tile_y in new_tiles:
+                if COST_TABLE[maze[tile_y][tile_x]] > 1:
+                    continue
+                if ((tile_x, tile_y) in path_tiles
+                        or any((tile_x + dx, tile_y + dy) in path_tiles
+                               for dx, dy in DIRECTIONS)):
+                    self.path_valid = False
+                    break
 
     def calculate_path(self, maze, fog_of_war=False):
         """Calculate path to goal using A* algorithm
@@ -61,97 +397,413 @@ class AIAgent:
         # Update AI's vision first
         self.update_vision(maze, fog_of_war=fog_of_war)
 
+        # A fresh plan is being computed against the current vision, so
+        # whatever invalidated the previous one is handled now
+        self.path_valid = True
+
         # Determine target based on remaining checkpoints
         target_x, target_y = None, None
 
-        # If there are checkpoints remaining, target the nearest one
+        # If there are checkpoints remaining, target the next one to visit
         if self.remaining_checkpoints:
-            # Find nearest checkpoint
-            nearest_checkpoint = min(self.remaining_checkpoints,
-                                    key=lambda pos: abs(pos[0] - self.tile_x) + abs(pos[1] - self.tile_y))
-            target_x, target_y = nearest_checkpoint
+            if not fog_of_war:
+                # Plan the whole visiting order once per maze and then just
+                # follow it, instead of rescanning for the nearest checkpoint
+                # on every replan
+                if self._tour_maze_ref is not maze:
+                    self._plan_checkpoint_tour(maze)
+                tour = self._checkpoint_tour
+                while tour and tour[0] not in self.remaining_checkpoints:
+                    tour.popleft()
+                if tour:
+                    target_x, target_y = tour[0]
+
+            if target_x is None:
+                # Fog of war (true distances unknown) or exhausted tour:
+                # fall back to the nearest checkpoint by Manhattan distance
+                nearest_checkpoint = min(self.remaining_checkpoints,
+                                        key=lambda pos: abs(pos[0] - self.tile_x) + abs(pos[1] - self.tile_y))
+                target_x, target_y = nearest_checkpoint
         else:
-            # All checkpoints collected, now go to goal
-            if fog_of_war:
-                # AI can only know about goal if it has explored that tile
-                for (x, y), terrain in self.known_maze.items():
-                    if terrain == TERRAIN_GOAL:
-                        target_x, target_y = x, y
-                        break
-            else:
-                # No fog of war - AI can see the entire maze
-                for y in range(len(maze)):
-                    for x in range(len(maze[0])):
-                        if maze[y][x] == TERRAIN_GOAL:
-                            target_x, target_y = x, y
+            # All checkpoints collected, now go to goal. The goal tile never
+            # moves, so once located it is cached until the maze object is
+            # replaced (restart or next level).
+            if self._goal_maze_ref is not maze:
+                self._goal_cache = None
+                self._goal_maze_ref = maze
+
+            if self._goal_cache is None:
+                if fog_of_war:
+                    # AI can only know about goal if it has explored that tile
+                    for (x, y), terrain in self.known_maze.items():
+                        if terrain == TERRAIN_GOAL:
+                            self._goal_cache = (x, y)
                             break
-                    if target_x is not None:
-                        break
+                else:
+                    # No fog of war - AI can see the entire maze. Coerce to
+                    # an array first: multi-agent mode passes a plain
+                    # list-of-lists maze
+                    goal_ys, goal_xs = np.where(np.asarray(maze) == TERRAIN_GOAL)
+                    if goal_xs.size:
+                        self._goal_cache = (int(goal_xs[0]), int(goal_ys[0]))
+
+            if self._goal_cache is not None:
+                target_x, target_y = self._goal_cache
 
         # If target not found, explore blindly
         if target_x is None:
             self._explore_blindly(maze, fog_of_war)
             return
 
+        # When the target is the fixed goal tile, every agent can share one
+        # goal-rooted Dijkstra field and just walk its next-step array
+        if not fog_of_war and not self.remaining_checkpoints:
+            self.path = deque(self._path_from_goal_field(maze, target_x, target_y))
+            return
+
+        # Without fog of war the whole maze is known, so the compiled grid
+        # kernel can be used; with fog of war the search must stay restricted
+        # to the tiles in known_maze
+        if not fog_of_war and (astar_core is not None or njit is not None):
+            self.path = deque(self._calculate_path_grid(maze, target_x, target_y))
+            return
+
+        # On uniform-cost mazes the pure-Python fallback can use Jump Point
+        # Search, which only expands jump points instead of every tile.
+        # Terrain with varying costs breaks JPS's symmetry argument, so
+        # those mazes keep the plain A* below.
+        if not fog_of_war and self._maze_is_uniform_cost(maze):
+            path = self._calculate_path_jps(maze, target_x, target_y)
+            self.path = deque(path) if path is not None else deque()
+            return
+
         # Use A* pathfinding to target
-        start = (self.tile_x, self.tile_y)
-        goal = (target_x, target_y)
+        height = len(maze)
+        width = len(maze[0])
+
+        # Work on a flat terrain buffer with packed integer positions
+        # (pos = y * width + x): one index per tile access instead of two,
+        # and plain ints as array/dict keys instead of tuples
+        if fog_of_war:
+            terrain_flat = self._known_flat
+        else:
+            if self._maze_flat_ref is not maze:
+                self._maze_flat = b"".join(bytes(row) for row in maze)
+                self._maze_flat_ref = maze
+            terrain_flat = self._maze_flat
+
+        start_pos = self.tile_y * width + self.tile_x
+        goal_pos = target_y * width + target_x
 
-        # Priority queue: (f_score, counter, position, path, cost)
-        counter = 0
-        open_set = []
-        heappush(open_set, (0, counter, start, [], 0))
+        # Priority queue of packed (f_score << 32) | position keys in a
+        # C-typed int64 array; g is recovered from f on pop since the
+        # Manhattan heuristic is cheap to recompute
+        open_set = array('q', [
+            ((abs(self.tile_x - target_x) + abs(self.tile_y - target_y)) << 32)
+            | start_pos
+        ])
 
-        # Track visited nodes and their costs
-        visited = {start: 0}
+        # Best known cost and packed parent index per tile, preallocated as
+        # flat arrays instead of tuple-keyed dicts
+        g_score = np.full(height * width, _INF, dtype=np.int32)
+        parent = np.full(height * width, -1, dtype=np.int32)
+        g_score[start_pos] = 0
+
+        # Memoized Manhattan distances to the current target (reset per call,
+        # so the cache is always consistent with the chosen target)
+        h_cache = {}
+
+        # Hoist hot-loop lookups into locals; globals and attributes are
+        # re-resolved on every iteration otherwise
+        push = _heap_push
+        pop = _heap_pop
+        cost_table = COST_TABLE
+        passable_table = PASSABLE_TABLE
+
+        # Best cost found to the goal so far; with an admissible heuristic,
+        # frontier entries whose f-score reaches it can never improve on it
+        best_goal_g = _INF
 
         while open_set:
-            f_score, _, current, path, current_cost = heappop(open_set)
-            current_x, current_y = current
+            key = pop(open_set)
 
-            # Check if we reached the target
-            if current == goal:
-                self.path = path
-                return
+            # Every remaining entry has f >= this one, so the recorded
+            # route to the goal is already optimal
+            if (key >> 32) >= best_goal_g:
+                break
+
+            current = key & 0xFFFFFFFF
+            current_y, current_x = divmod(current, width)
+            current_cost = (key >> 32) - (abs(current_x - target_x)
+                                          + abs(current_y - target_y))
+
+            # Lazy decrease-key: entries superseded by a cheaper relaxation
+            # are left in the heap and skipped when popped
+            if current_cost > g_score[current]:
+                continue
 
             # Explore neighbors (4 directions)
-            for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
+            for dx, dy in DIRECTIONS:
                 next_x = current_x + dx
                 next_y = current_y + dy
-                next_pos = (next_x, next_y)
 
                 # Check bounds
-                if not (0 <= next_y < len(maze) and 0 <= next_x < len(maze[0])):
+                if not (0 <= next_y < height and 0 <= next_x < width):
                     continue
 
-                # In fog of war mode, only consider explored tiles
-                if fog_of_war and next_pos not in self.known_maze:
+                next_pos = next_y * width + next_x
+
+                # Unrevealed tiles (fog of war) stay off limits
+                terrain = terrain_flat[next_pos]
+                if terrain == _UNKNOWN:
                     continue
 
                 # Check if passable
-                terrain = self.known_maze.get(next_pos, maze[next_y][next_x]) if fog_of_war else maze[next_y][next_x]
-                if not is_passable(terrain):
+                if not passable_table[terrain]:
                     continue
 
                 # Calculate cost (g_score)
-                move_cost = get_terrain_cost(terrain)
+                move_cost = cost_table[terrain]
                 new_cost = current_cost + move_cost
 
                 # If we found a better path to this node
-                if next_pos not in visited or new_cost < visited[next_pos]:
-                    visited[next_pos] = new_cost
+                if new_cost < g_score[next_pos]:
+                    g_score[next_pos] = new_cost
+                    parent[next_pos] = current
+
+                    # Relaxing the goal itself just tightens the bound;
+                    # the goal never needs to be expanded
+                    if next_pos == goal_pos:
+                        best_goal_g = new_cost
+                        continue
 
                     # Heuristic (h_score): Manhattan distance to target
-                    h_score = abs(next_x - target_x) + abs(next_y - target_y)
-                    f_score = new_cost + h_score
+                    h_score = h_cache.get(next_pos)
+                    if h_score is None:
+                        h_score = abs(next_x - target_x) + abs(next_y - target_y)
+                        h_cache[next_pos] = h_score
+
+                    # Entries that cannot beat the best known goal route
+                    # are pruned instead of pushed
+                    if new_cost + h_score >= best_goal_g:
+                        continue
 
                     # Add to open set
-                    new_path = path + [next_pos]
-                    counter += 1
-                    heappush(open_set, (f_score, counter, next_pos, new_path, new_cost))
+                    push(open_set, ((new_cost + h_score) << 32) | next_pos)
+
+        if best_goal_g < _INF:
+            self.path = deque(self._reconstruct_path(
+                parent, start_pos, goal_pos, width
+            ))
+            return
 
         # No path found
-        self.path = []
+        self.path = deque()
+
+    def _maze_is_uniform_cost(self, maze):
+        """Check whether every passable tile costs 1 (cached per maze)"""
+        if self._uniform_maze_ref is not maze:
+            self._uniform_maze_ref = maze
+            self._uniform_cost = all(
+                COST_TABLE[cell] == 1
+                for row in maze for cell in row if PASSABLE_TABLE[cell]
+            )
+        return self._uniform_cost
+
+    def _calculate_path_jps(self, maze, target_x, target_y):
+        """Jump Point Search over a uniform-cost 4-connected grid
+
+        Instead of pushing every neighbor, each expansion scans straight
+        lines and stops only at "jump points": the goal, or tiles where a
+        wall just ended and a forced turn becomes possible. Vertical is the
+        primary scan direction and spawns horizontal scans, the canonical
+        ordering for 4-connected grids; horizontal scans only turn at
+        forced neighbors.
+
+        Returns the per-tile path (excluding the start), or None when the
+        target is unreachable.
+        """
+        height = len(maze)
+        width = len(maze[0])
+        passable_table = PASSABLE_TABLE
+        gx, gy = target_x, target_y
+
+        def passable(x, y):
+            return 0 <= x < width and 0 <= y < height and passable_table[maze[y][x]]
+
+        def jump_horizontal(x, y, dx):
+            while True:
+                x += dx
+                if not passable(x, y):
+                    return None
+                if x == gx and y == gy:
+                    return (x, y)
+                # Forced neighbor: a vertical opening just past a wall
+                if (passable(x, y + 1) and not passable(x - dx, y + 1)) or \
+                   (passable(x, y - 1) and not passable(x - dx, y - 1)):
+                    return (x, y)
+
+        def jump_vertical(x, y, dy):
+            while True:
+                y += dy
+                if not passable(x, y):
+                    return None
+                if x == gx and y == gy:
+                    return (x, y)
+                if (passable(x + 1, y) and not passable(x + 1, y - dy)) or \
+                   (passable(x - 1, y) and not passable(x - 1, y - dy)):
+                    return (x, y)
+                # Primary direction: spawn horizontal scans from every cell
+                if jump_horizontal(x, y, 1) is not None or \
+                        jump_horizontal(x, y, -1) is not None:
+                    return (x, y)
+
+        start = (self.tile_x, self.tile_y)
+        goal = (gx, gy)
+        open_set = [(abs(start[0] - gx) + abs(start[1] - gy), start, 0)]
+        g_score = {start: 0}
+        came_from = {start: None}
+
+        while open_set:
+            f_score, current, current_cost = heappop(open_set)
+            if current_cost > g_score.get(current, _INF):
+                continue
+            if current == goal:
+                return self._expand_jump_path(came_from, goal)
+
+            cx, cy = current
+            for jump_point in (jump_horizontal(cx, cy, 1),
+                               jump_horizontal(cx, cy, -1),
+                               jump_vertical(cx, cy, 1),
+                               jump_vertical(cx, cy, -1)):
+                if jump_point is None:
+                    continue
+                jx, jy = jump_point
+                new_cost = current_cost + abs(jx - cx) + abs(jy - cy)
+                if new_cost < g_score.get(jump_point, _INF):
+                    g_score[jump_point] = new_cost
+                    came_from[jump_point] = current
+                    heappush(open_set, (new_cost + abs(jx - gx) + abs(jy - gy),
+                                        jump_point, new_cost))
+
+        return None
+
+    def _expand_jump_path(self, came_from, goal):
+        """Expand a chain of axis-aligned jump points into per-tile steps"""
+        waypoints = []
+        node = goal
+        while node is not None:
+            waypoints.append(node)
+            node = came_from[node]
+        waypoints.reverse()
+
+        path = []
+        for (x0, y0), (x1, y1) in zip(waypoints, waypoints[1:]):
+            step_x = (x1 > x0) - (x1 < x0)
+            step_y = (y1 > y0) - (y1 < y0)
+            x, y = x0, y0
+            while (x, y) != (x1, y1):
+                x += step_x
+                y += step_y
+                path.append((x, y))
+        return path
+
+    def _plan_checkpoint_tour(self, maze):
+        """Order the remaining checkpoints as a greedy nearest-neighbor tour
+
+        Builds true path distances between the agent and every checkpoint
+        (one Dijkstra flood per point of interest), then repeatedly chains
+        the nearest unvisited checkpoint. The order is cached until the
+        maze object is replaced, so replans become a simple lookup.
+        """
+        start = (self.tile_x, self.tile_y)
+        points = list(self.remaining_checkpoints)
+
+        dist_from = {point: self._dijkstra_distances(maze, point) for point in points}
+        current_dist = self._dijkstra_distances(maze, start)
+
+        tour = []
+        remaining = set(points)
+        while remaining:
+            nearest = min(remaining, key=lambda pos: current_dist.get(pos, _INF))
+            tour.append(nearest)
+            remaining.discard(nearest)
+            current_dist = dist_from[nearest]
+
+        self._checkpoint_tour = deque(tour)
+        self._tour_maze_ref = maze
+
+    def _dijkstra_distances(self, maze, source):
+        """Flood the maze from source, returning {(x, y): cost} for every
+        reachable tile"""
+        height = len(maze)
+        width = len(maze[0])
+        cost_table = COST_TABLE
+        passable_table = PASSABLE_TABLE
+
+        dist = {source: 0}
+        open_set = [(0, source)]
+        while open_set:
+            current_cost, current = heappop(open_set)
+            if current_cost > dist[current]:
+                continue
+            x, y = current
+            for dx, dy in DIRECTIONS:
+                nx, ny = x + dx, y + dy
+                if not (0 <= ny < height and 0 <= nx < width):
+                    continue
+                terrain = maze[ny][nx]
+                if not passable_table[terrain]:
+                    continue
+                new_cost = current_cost + cost_table[terrain]
+                next_pos = (nx, ny)
+                if new_cost < dist.get(next_pos, _INF):
+                    dist[next_pos] = new_cost
+                    heappush(open_set, (new_cost, next_pos))
+        return dist
+
+    def _path_from_goal_field(self, maze, goal_x, goal_y):
+        """Walk the shared goal-rooted next-step field from this agent's tile
+
+        Returns the path as a list of (x, y) tuples, excluding the start
+        tile; empty when the goal is unreachable.
+        """
+        width = len(maze[0])
+        dist, step = _goal_distance_field(maze, goal_x, goal_y)
+        pos = self.tile_y * width + self.tile_x
+        if dist[pos] >= _INF:
+            return []
+        goal_pos = goal_y * width + goal_x
+        path = []
+        while pos != goal_pos:
+            pos = int(step[pos])
+            path.append((pos % width, pos // width))
+        return path
+
+    def _calculate_path_grid(self, maze, target_x, target_y):
+        """Run the grid kernel, converting the maze to uint8 once per maze"""
+        if self._maze_ref is not maze:
+            self._maze_np = np.asarray(maze, dtype=np.uint8)
+            self._maze_ref = maze
+
+        width = self._maze_np.shape[1]
+        kernel = astar_core.astar if astar_core is not None else _astar_grid
+        packed = kernel(self._maze_np, self.tile_x, self.tile_y,
+                        target_x, target_y, _COST_LUT)
+        return [(int(pos) % width, int(pos) // width) for pos in packed]
+
+    def _reconstruct_path(self, parent, start_pos, goal_pos, width):
+        """Walk the packed parent array backward from the goal to rebuild the path
+
+        Returns the path as a list of (x, y) tuples, excluding the start tile.
+        """
+        path = []
+        node = goal_pos
+        while node != start_pos:
+            path.append((int(node) % width, int(node) // width))
+            node = parent[node]
+        path.reverse()
+        return path
 
     def _explore_blindly(self, maze, fog_of_war):
         """When goal is not visible, move towards unexplored areas
@@ -169,7 +821,7 @@ class AIAgent:
 
         # Check tiles adjacent to explored area
         for (ex, ey) in self.explored_tiles:
-            for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
+            for dx, dy in DIRECTIONS:
                 nx, ny = ex + dx, ey + dy
                 if (nx, ny) not in self.explored_tiles:
                     if 0 <= nx < len(maze[0]) and 0 <= ny < len(maze):
@@ -189,45 +841,100 @@ class AIAgent:
                         return
 
         # Fallback: move to any adjacent explored passable tile
-        for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
+        for dx, dy in DIRECTIONS:
             nx, ny = self.tile_x + dx, self.tile_y + dy
             if (nx, ny) in self.known_maze and is_passable(self.known_maze[(nx, ny)]):
-                self.path = [(nx, ny)]
+                self.path = deque([(nx, ny)])
                 return
 
-        self.path = []
+        self.path = deque()
 
     def _pathfind_in_known_area(self, target):
-        """Pathfind to a target within the known area"""
+        """Pathfind to a target within the known area
+
+        Uses bidirectional BFS: frontiers expand from both ends and meet in
+        the middle, so far fewer tiles are visited than with one-sided BFS.
+        Parent maps are kept for reconstruction instead of copying partial
+        paths onto the queue.
+        """
         start = (self.tile_x, self.tile_y)
+        known_maze = self.known_maze
+        passable_table = PASSABLE_TABLE
+
+        if target == start:
+            self.path = deque()
+            return
 
-        # Simple BFS for short paths
-        from collections import deque
-        queue = deque([(start, [])])
-        visited = {start}
+        # The backward search starts at the target, so its passability has
+        # to be checked up front
+        terrain = known_maze.get(target)
+        if terrain is None or not passable_table[terrain]:
+            self.path = deque()
+            return
 
-        while queue:
-            current, path = queue.popleft()
+        # Frontiers and parent maps for both search directions
+        fwd_queue = deque([start])
+        bwd_queue = deque([target])
+        fwd_parent = {start: None}
+        bwd_parent = {target: None}
 
-            if current == target:
-                self.path = path
-                return
+        meeting = None
+        while fwd_queue and bwd_queue and meeting is None:
+            # Expand one full layer of the smaller frontier
+            if len(fwd_queue) <= len(bwd_queue):
+                queue, parent, other = fwd_queue, fwd_parent, bwd_parent
+            else:
+                queue, parent, other = bwd_queue, bwd_parent, fwd_parent
 
-            for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                nx, ny = current[0] + dx, current[1] + dy
-                next_pos = (nx, ny)
+            for _ in range(len(queue)):
+                current = queue.popleft()
 
-                if next_pos in visited:
-                    continue
-                if next_pos not in self.known_maze:
-                    continue
-                if not is_passable(self.known_maze[next_pos]):
-                    continue
+                for dx, dy in DIRECTIONS:
+                    next_pos = (current[0] + dx, current[1] + dy)
+
+                    if next_pos in parent:
+                        continue
+                    terrain = known_maze.get(next_pos)
+                    if terrain is None or not passable_table[terrain]:
+                        continue
+
+                    parent[next_pos] = current
+                    if next_pos in other:
+                        # Frontiers met - next_pos is now in both parent maps
+                        meeting = next_pos
+                        break
+                    queue.append(next_pos)
+
+                if meeting is not None:
+                    break
+
+        if meeting is None:
+            self.path = deque()
+            return
+
+        # Splice the two half-paths together at the meeting point
+        path = []
+        node = meeting
+        while node is not None:
+            path.append(node)
+            node = fwd_parent[node]
+        path.reverse()  # Now runs start -> meeting
 
-                visited.add(next_pos)
-                queue.append((next_pos, path + [next_pos]))
+        node = bwd_parent[meeting]
+        while node is not None:
+            path.append(node)
+            node = bwd_parent[node]
 
-        self.path = []
+        # Drop the start tile, matching calculate_path's convention
+        self.path = deque(path[1:])
+
+    def needs_replan(self):
+        """Whether the game loop should call calculate_path before the next move
+
+        True when the current path has run out or was invalidated (checkpoint
+        collected, energy depleted, or fog of war revealed a shortcut).
+        """
+        return not self.path_valid or not self.path
 
     def make_move(self, maze):
         """Make one move along the calculated path"""
@@ -239,17 +946,18 @@ class AIAgent:
 
         # Check energy before moving
         terrain = maze[next_y][next_x]
-        move_cost = get_terrain_cost(terrain)
+        move_cost = COST_TABLE[terrain]
 
         if self.energy_limit is not None:
             if self.total_cost + move_cost > self.energy_limit:
                 # Out of energy - can't make this move
                 self.out_of_energy = True
-                self.path = []
+                self.path = deque()
+                self.path_valid = False
                 return False
 
         # Execute move
-        self.path = self.path[1:]  # Remove first element
+        self.path.popleft()  # Remove first element in O(1)
         self.total_cost += move_cost
         self.tile_x = next_x
         self.tile_y = next_y
@@ -263,14 +971,15 @@ class AIAgent:
                 # Don't reset cost - keep accumulating
                 # self.exploration_cost += self.total_cost
                 # self.total_cost = 0
-                self.remaining_checkpoints.remove((next_x, next_y))
+                self.remaining_checkpoints.discard((next_x, next_y))
                 # Don't convert checkpoint to grass - let rendering handle visibility
                 # maze[next_y][next_x] = TERRAIN_GRASS
                 print(f"✓ {self.name} collected checkpoint! ({self.checkpoints_collected})")
             else:
                 # Checkpoint position but not grass/checkpoint terrain (weird edge case)
-                self.remaining_checkpoints.remove((next_x, next_y))
-            # Path will be recalculated by the main game loop before next move
+                self.remaining_checkpoints.discard((next_x, next_y))
+            # The target changed, so the game loop must replan before next move
+            self.path_valid = False
             return True
 
         # Check if reached goal
@@ -279,7 +988,8 @@ class AIAgent:
             if not self.remaining_checkpoints:
                 self.finished = True
                 return True
-            # If at goal but haven't collected all checkpoints, path will be recalculated by main loop
+            # At goal but checkpoints remain - a new target must be picked
+            self.path_valid = False
 
         return True
 
@@ -310,13 +1020,11 @@ class AIAgent:
             return
 
         # Draw path as semi-transparent lines
-        points = [(self.tile_x * tile_size + tile_size // 2,
-                  self.tile_y * tile_size + tile_size // 2)]
-
-        for x, y in self.path:
-            center_x = x * tile_size + tile_size // 2
-            center_y = y * tile_size + tile_size // 2
-            points.append((center_x, center_y))
+        half = tile_size // 2
+        points = [(self.tile_x * tile_size + half,
+                   self.tile_y * tile_size + half)]
+        points.extend((x * tile_size + half, y * tile_size + half)
+                      for x, y in self.path)
 
         if len(points) > 1:
             # Draw dashed line showing the path
@@ -0,0 +1,148 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True
+"""Optional Cython backend for the AI pathfinding inner loop
+
+Build in place with:
+
+    python setup.py build_ext --inplace
+
+ai_agent.py picks this module up automatically once built and falls back
+to the Numba/pure-Python kernels otherwise. The algorithm mirrors
+ai_agent._astar_grid: flat g-score/parent arrays and a binary heap of
+packed (f_score << 32) | position int64 keys.
+"""
+
+import numpy as np
+
+cimport numpy as cnp
+
+DEF INF = 1073741824  # 2 ** 30, matches ai_agent._INF
+
+
+def astar(cnp.uint8_t[:, :] maze, int sx, int sy, int gx, int gy,
+          cnp.int32_t[:] cost_lut):
+    """A* over a uint8 terrain grid
+
+    Returns a 1D int32 array of packed positions (y * width + x) from the
+    tile after the start up to the goal, or an empty array when the goal
+    is unreachable.
+    """
+    cdef int height = maze.shape[0]
+    cdef int width = maze.shape[1]
+    cdef int size = height * width
+    cdef int start = sy * width + sx
+    cdef int goal = gy * width + gx
+
+    g_np = np.full(size, INF, dtype=np.int32)
+    parent_np = np.full(size, -1, dtype=np.int32)
+    cdef cnp.int32_t[::1] g_score = g_np
+    cdef cnp.int32_t[::1] parent = parent_np
+    g_score[start] = 0
+
+    cdef int cap = size
+    heap_np = np.empty(cap, dtype=np.int64)
+    cdef cnp.int64_t[::1] heap = heap_np
+    heap[0] = ((<long long> (abs(sx - gx) + abs(sy - gy))) << 32) | start
+    cdef int heap_len = 1
+
+    cdef bint found = False
+    cdef long long key, last, new_key
+    cdef int i, child, right, pos, x, y, g, d, nx, ny
+    cdef int next_pos, move_cost, new_cost, up, length, node
+
+    while heap_len > 0:
+        key = heap[0]
+
+        # Pop the root: move the last entry up and sift it down
+        heap_len -= 1
+        last = heap[heap_len]
+        i = 0
+        while True:
+            child = 2 * i + 1
+            if child >= heap_len:
+                break
+            right = child + 1
+            if right < heap_len and heap[right] < heap[child]:
+                child = right
+            if heap[child] < last:
+                heap[i] = heap[child]
+                i = child
+            else:
+                break
+        if heap_len > 0:
+            heap[i] = last
+
+        pos = <int> (key & 0xFFFFFFFF)
+        x = pos % width
+        y = pos // width
+
+        # Recover g from the packed f-score and skip stale entries
+        g = <int> (key >> 32) - (abs(x - gx) + abs(y - gy))
+        if g > g_score[pos]:
+            continue
+
+        if pos == goal:
+            found = True
+            break
+
+        for d in range(4):
+            if d == 0:
+                nx = x
+                ny = y + 1
+            elif d == 1:
+                nx = x + 1
+                ny = y
+            elif d == 2:
+                nx = x
+                ny = y - 1
+            else:
+                nx = x - 1
+                ny = y
+
+            if nx < 0 or nx >= width or ny < 0 or ny >= height:
+                continue
+
+            next_pos = ny * width + nx
+            move_cost = cost_lut[maze[ny, nx]]
+            if move_cost >= INF:
+                continue
+
+            new_cost = g + move_cost
+            if new_cost < g_score[next_pos]:
+                g_score[next_pos] = new_cost
+                parent[next_pos] = pos
+                new_key = ((<long long> (new_cost + abs(nx - gx) + abs(ny - gy))) << 32) | next_pos
+
+                # Push: grow the heap if full, then sift up
+                if heap_len == cap:
+                    cap *= 2
+                    grown_np = np.empty(cap, dtype=np.int64)
+                    grown_np[:heap_len] = heap_np[:heap_len]
+                    heap_np = grown_np
+                    heap = heap_np
+                i = heap_len
+                heap_len += 1
+                while i > 0:
+                    up = (i - 1) // 2
+                    if heap[up] > new_key:
+                        heap[i] = heap[up]
+                        i = up
+                    else:
+                        break
+                heap[i] = new_key
+
+    if not found:
+        return np.empty(0, dtype=np.int32)
+
+    # Walk the parent array backward to build the path (excluding start)
+    length = 0
+    node = goal
+    while node != start:
+        length += 1
+        node = parent[node]
+    path_np = np.empty(length, dtype=np.int32)
+    cdef cnp.int32_t[::1] path = path_np
+    node = goal
+    for i in range(length - 1, -1, -1):
+        path[i] = node
+        node = parent[node]
+    return path_np
@@ -1,5 +1,26 @@
 import pygame
 from collections import deque
+from heapq import heappush, heappop
+
+import numpy as np
+
+from maze_generation import is_passable, get_terrain_cost
+
+import pathfinding_core
+
+try:
+    import astar_core  # Compiled A* backend (python setup.py build_ext --inplace)
+except ImportError:
+    astar_core = None
+
+# Movement key -> (dx, dy), so keyboard handling is one dict lookup
+# instead of an elif chain
+KEY_DIR = {
+    pygame.K_w: (0, -1), pygame.K_UP: (0, -1),
+    pygame.K_s: (0, 1), pygame.K_DOWN: (0, 1),
+    pygame.K_a: (-1, 0), pygame.K_LEFT: (-1, 0),
+    pygame.K_d: (1, 0), pygame.K_RIGHT: (1, 0),
+}
 
 
 class InputController:
@@ -10,25 +31,25 @@ class InputController:
         self.pathfinding_active = False  # Toggle state for pathfinding
         self.current_path = []
         self.path_index = 0
+        # Last pathfinding request, so a repeat click on the same tile
+        # from the same position reuses the previous result
+        self._last_target = None
+        self._last_origin = None
+        self._last_maze = None
+        self._last_path = []
+        self._last_move_ms = 0  # Timestamp of the last path-following move
 
     def handle_keyboard_input(self, event, player, maze):
         """Handle keyboard movement (WASD or Arrow keys)"""
         if event.type != pygame.KEYDOWN:
             return 0
 
-        move_cost = 0
-
         # Movement with WASD or Arrow keys
-        if event.key in (pygame.K_w, pygame.K_UP):
-            move_cost = player.move(0, -1, maze)
-        elif event.key in (pygame.K_s, pygame.K_DOWN):
-            move_cost = player.move(0, 1, maze)
-        elif event.key in (pygame.K_a, pygame.K_LEFT):
-            move_cost = player.move(-1, 0, maze)
-        elif event.key in (pygame.K_d, pygame.K_RIGHT):
-            move_cost = player.move(1, 0, maze)
+        dx, dy = KEY_DIR.get(event.key, (0, 0))
+        if dx == 0 and dy == 0:
+            return 0
 
-        return move_cost
+        return player.move(dx, dy, maze)
 
     def handle_mouse_input(self, event, player, maze):
         """Handle mouse click to toggle pathfinding on/off"""
@@ -45,28 +66,46 @@ class InputController:
                 target_tile_x = mouse_x // self.tile_size
                 target_tile_y = mouse_y // self.tile_size
 
-                # Find path from player to target
-                self.current_path = self._find_path(
-                    player.tile_x, player.tile_y,
-                    target_tile_x, target_tile_y,
-                    maze
-                )
+                target = (target_tile_x, target_tile_y)
+                origin = (player.tile_x, player.tile_y)
+                if target == origin:
+                    return  # Already standing on the target tile
+
+                # Only recompute when the request actually changed; the
+                # maze is compared by identity since dynamic mode swaps
+                # in a new grid object on level-up
+                if (target == self._last_target and origin == self._last_origin
+                        and maze is self._last_maze):
+                    self.current_path = list(self._last_path)
+                else:
+                    self.current_path = self._find_path(
+                        player.tile_x, player.tile_y,
+                        target_tile_x, target_tile_y,
+                        maze
+                    )
+                    self._last_target = target
+                    self._last_origin = origin
+                    self._last_maze = maze
+                    self._last_path = list(self.current_path)
                 if self.current_path:  # Only activate if a valid path was found
                     self.pathfinding_active = True
                     self.path_index = 0
 
-    def update_mouse_movement(self, player, maze, delay_frames=10):
+    def update_mouse_movement(self, player, maze, delay_ms=100):
         """Update player position along the path (called every frame)
 
         Args:
-            delay_frames: Number of frames to wait between moves (lower = faster)
+            delay_ms: Milliseconds to wait between moves (lower = faster)
         """
         if not self.pathfinding_active or not self.current_path:
             return 0
 
-        # Move along the path at a controlled speed
+        # Move along the path at a controlled speed, independent of the
+        # frame rate: one step each time delay_ms has elapsed
         if self.path_index < len(self.current_path):
-            if pygame.time.get_ticks() % delay_frames == 0:  # Control movement speed
+            now = pygame.time.get_ticks()
+            if now - self._last_move_ms >= delay_ms:
+                self._last_move_ms = now
                 next_x, next_y = self.current_path[self.path_index]
 
                 # Calculate direction to next tile
@@ -103,33 +142,50 @@ class InputController:
         if not (0 <= target_y < len(maze) and 0 <= target_x < len(maze[0])):
             return []
 
-        # Import terrain checking functions
-        from maze_generation import is_passable
-
         # Check if target is passable
         if not is_passable(maze[target_y][target_x]):
             return []
 
-        # A* pathfinding
-        from heapq import heappush, heappop
+        # Use the compiled A* core when it has been built; it returns the
+        # path as packed y * width + x positions excluding the start tile
+        if astar_core is not None:
+            grid = np.asarray(maze, dtype=np.uint8)
+            width = grid.shape[1]
+            packed = astar_core.astar(grid, start_x, start_y,
+                                      target_x, target_y,
+                                      pathfinding_core.COST_LUT)
+            return [(int(pos) % width, int(pos) // width) for pos in packed]
+
+        # A* pathfinding, with the hot heap operations bound to locals
+        push = heappush
+        pop = heappop
 
         start = (start_x, start_y)
         goal = (target_x, target_y)
 
-        # Priority queue: (f_score, counter, position, path)
+        # Priority queue: (f_score, counter, position). The path is
+        # rebuilt from came_from at the end instead of copying a growing
+        # list into every heap entry
         counter = 0
         open_set = []
-        heappush(open_set, (0, counter, start, []))
+        push(open_set, (0, counter, start))
+        came_from = {}
 
         # Track visited nodes and their costs
         visited = {start: 0}
 
         while open_set:
-            f_score, _, current, path = heappop(open_set)
+            f_score, _, current = pop(open_set)
             current_x, current_y = current
 
             # Check if we reached the goal
             if current == goal:
+                # Walk the came_from chain back to the start
+                path = []
+                while current != start:
+                    path.append(current)
+                    current = came_from[current]
+                path.reverse()
                 return path
 
             # Explore neighbors (4 directions)
@@ -147,22 +203,21 @@ class InputController:
                     continue
 
                 # Calculate cost (g_score)
-                from maze_generation import get_terrain_cost
                 move_cost = get_terrain_cost(maze[next_y][next_x])
                 new_cost = visited[current] + move_cost
 
                 # If we found a better path to this node
                 if next_pos not in visited or new_cost < visited[next_pos]:
                     visited[next_pos] = new_cost
+                    came_from[next_pos] = current
 
                     # Heuristic (h_score): Manhattan distance
                     h_score = abs(next_x - target_x) + abs(next_y - target_y)
                     f_score = new_cost + h_score
 
                     # Add to open set
-                    new_path = path + [next_pos]
                     counter += 1
-                    heappush(open_set, (f_score, counter, next_pos, new_path))
+                    push(open_set, (f_score, counter, next_pos))
 
         # No path found
         return []
@@ -2,13 +2,19 @@ import pygame
 import sys
 import os
 import random
+import functools
+
+import numpy as np
+
 from maze_generation import (
-    generate_maze, create_simple_maze, get_terrain_cost, is_passable,
+    generate_maze, get_terrain_cost, is_passable,
+    COST_TABLE, PASSABLE_TABLE,
     TERRAIN_GRASS, TERRAIN_WALL, TERRAIN_START, TERRAIN_GOAL,
     TERRAIN_WATER, TERRAIN_MUD, TERRAIN_LAVA, TERRAIN_CHECKPOINT
 )
-from controls import InputController
+from controls import InputController, KEY_DIR
 from ai_agent import AIAgent
+import maze_kernels
 
 # Initialize pygame
 pygame.init()
@@ -54,6 +60,20 @@ PURPLE = (180, 50, 255)
 ORANGE = (255, 165, 0)
 CYAN = (0, 255, 255)
 
+# Milliseconds between repeated moves while a movement key is held
+KEY_REPEAT_MS = 150
+
+# Fog-of-war vision radius (Manhattan), with the in-range offsets
+# precomputed: updates walk the 61-tile diamond directly instead of
+# testing every cell of the enclosing 121-tile square
+VISION_RANGE = 5
+VISION_OFFSETS = tuple(
+    (dx, dy)
+    for dy in range(-VISION_RANGE, VISION_RANGE + 1)
+    for dx in range(-VISION_RANGE, VISION_RANGE + 1)
+    if abs(dx) + abs(dy) <= VISION_RANGE
+)
+
 # Setup screen
 screen = pygame.display.set_mode((TOTAL_WINDOW_WIDTH, TOTAL_WINDOW_HEIGHT))
 pygame.display.set_caption("Maze Runner - Navigate to the Goal!")
@@ -65,11 +85,13 @@ def load_sprite(filename, size=TILE_SIZE):
     path = os.path.join("sprites", filename)
     try:
         sprite = pygame.image.load(path).convert_alpha()
-        return pygame.transform.scale(sprite, (size, size))
+        # Re-convert after scaling: transform.scale returns a surface
+        # that is not guaranteed to match the display format
+        return pygame.transform.scale(sprite, (size, size)).convert_alpha()
     except pygame.error as e:
         print(f"Warning: Could not load {filename}: {e}")
         # Return a colored surface as fallback
-        surf = pygame.Surface((size, size))
+        surf = pygame.Surface((size, size)).convert()
         surf.fill((100, 100, 100))
         return surf
 
@@ -81,9 +103,158 @@ mud_sprite = load_sprite("mud.png")
 lava_sprite = load_sprite("lava.png")
 wall_sprite = load_sprite("wall.png")
 
+# Semi-transparent tint overlays, built once instead of allocating a new
+# Surface for every START/GOAL/checkpoint/fog tile on every frame
+def _make_overlay(color, alpha):
+    overlay = pygame.Surface((TILE_SIZE, TILE_SIZE)).convert()
+    overlay.fill(color)
+    overlay.set_alpha(alpha)
+    return overlay
+
+start_overlay = _make_overlay(GREEN, 120)
+goal_overlay = _make_overlay(RED, 120)
+checkpoint_overlay = _make_overlay(YELLOW, 100)
+fog_overlay = _make_overlay(BLACK, 120)
+
+
+def _compose_marker_tiles():
+    """Bake the start/goal/checkpoint markers into standalone tiles
+
+    Composing the tint (and the goal flag / checkpoint ring) onto grass
+    once means the draw loops blit a single finished sprite per tile
+    instead of layering overlays and draw calls each time.
+    """
+    start_tile = grass_sprite.copy()
+    start_tile.blit(start_overlay, (0, 0))
+
+    goal_tile = grass_sprite.copy()
+    goal_tile.blit(goal_overlay, (0, 0))
+    rect = goal_tile.get_rect()
+    pygame.draw.line(goal_tile, RED,
+                     (rect.centerx, rect.top + 2),
+                     (rect.centerx, rect.bottom - 2), 2)
+    flag_tri = [
+        (rect.centerx, rect.top + 2),
+        (rect.centerx + 6, rect.top + 5),
+        (rect.centerx, rect.top + 8),
+    ]
+    pygame.draw.polygon(goal_tile, RED, flag_tri)
+
+    checkpoint_tile = grass_sprite.copy()
+    checkpoint_tile.blit(checkpoint_overlay, (0, 0))
+    pygame.draw.circle(checkpoint_tile, YELLOW, rect.center, TILE_SIZE // 4, 3)
+
+    return (start_tile.convert_alpha(), goal_tile.convert_alpha(),
+            checkpoint_tile.convert_alpha())
+
+
+start_tile_sprite, goal_tile_sprite, checkpoint_tile_sprite = _compose_marker_tiles()
+
+
+def _compose_player_sprite():
+    """Draw the player's circle-with-outline character once at load"""
+    sprite = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+    pygame.draw.circle(sprite, BLUE, (TILE_SIZE // 2, TILE_SIZE // 2), TILE_SIZE // 3)
+    pygame.draw.circle(sprite, WHITE, (TILE_SIZE // 2, TILE_SIZE // 2), TILE_SIZE // 3, 2)
+    return sprite.convert_alpha()
+
+
+PLAYER_SPRITE = _compose_player_sprite()
+
+# Sprite per terrain id: one list index replaces the per-tile elif ladder
+# (unknown ids fall back to the empty sprite)
+TILE_SPRITES = [empty_sprite] * 256
+TILE_SPRITES[TERRAIN_GRASS] = grass_sprite
+TILE_SPRITES[TERRAIN_CHECKPOINT] = grass_sprite
+TILE_SPRITES[TERRAIN_WALL] = wall_sprite
+TILE_SPRITES[TERRAIN_WATER] = water_sprite
+TILE_SPRITES[TERRAIN_MUD] = mud_sprite
+TILE_SPRITES[TERRAIN_LAVA] = lava_sprite
+TILE_SPRITES[TERRAIN_START] = start_tile_sprite
+TILE_SPRITES[TERRAIN_GOAL] = goal_tile_sprite
+
+def _build_tile_atlas():
+    """Pack every tile sprite into a single atlas surface
+
+    Background builds then blit sub-rects of one source surface instead
+    of bouncing between per-tile surfaces, which keeps the copy loop on
+    a single texture. Identical sprites (e.g. grass reused for
+    checkpoints) share one slot.
+    """
+    slot_of = {}
+    unique = []
+    for sprite in TILE_SPRITES + [checkpoint_tile_sprite]:
+        if id(sprite) not in slot_of:
+            slot_of[id(sprite)] = len(unique)
+            unique.append(sprite)
+
+    atlas = pygame.Surface((TILE_SIZE * len(unique), TILE_SIZE)).convert()
+    for i, sprite in enumerate(unique):
+        atlas.blit(sprite, (i * TILE_SIZE, 0))
+
+    rects = [pygame.Rect(slot_of[id(sprite)] * TILE_SIZE, 0, TILE_SIZE, TILE_SIZE)
+             for sprite in TILE_SPRITES]
+    checkpoint_rect = pygame.Rect(slot_of[id(checkpoint_tile_sprite)] * TILE_SIZE,
+                                  0, TILE_SIZE, TILE_SIZE)
+    return atlas, rects, checkpoint_rect
+
+
+TILE_ATLAS, ATLAS_RECTS, CHECKPOINT_ATLAS_RECT = _build_tile_atlas()
+
+# UI fonts, created once instead of on every draw_ui call
+FONT_TITLE = pygame.font.Font(None, 48)
+FONT_TEXT = pygame.font.Font(None, 32)
+FONT_SMALL = pygame.font.Font(None, 28)
+FONT_TINY = pygame.font.Font(None, 22)
+
+# Rendered-label cache: most UI strings repeat frame after frame, so
+# rasterizing them once and blitting the cached surface is far cheaper
+_text_cache = {}
+
+
+def _render_text(font, text, color):
+    """Render text, reusing the surface from a previous identical render"""
+    key = (id(font), text, color)
+    surf = _text_cache.get(key)
+    if surf is None:
+        surf = _text_cache[key] = font.render(text, True, color)
+    return surf
+
+
+@functools.lru_cache(maxsize=512)
+def _render_number(font, text, color):
+    """Render a counter label through a bounded cache
+
+    Counter values churn for the whole session, so unlike the fixed
+    labels in _text_cache these go through an LRU that evicts stale
+    values instead of growing without bound.
+    """
+    return font.render(text, True, color)
+
+# Passability bitmap, cached per maze object: a (H+2, W+2) bool array
+# whose one-tile border is always False, so a single indexed load covers
+# both the bounds check and the wall check for a unit step
+_passable_cache = (None, None)
+
+
+def _passable_bitmap(maze):
+    global _passable_cache
+    cached_maze, bitmap = _passable_cache
+    if cached_maze is not maze:
+        height, width = maze.shape
+        bitmap = np.zeros((height + 2, width + 2), dtype=bool)
+        bitmap[1:-1, 1:-1] = np.asarray(PASSABLE_TABLE, dtype=bool)[maze]
+        _passable_cache = (maze, bitmap)
+    return bitmap
+
+
 class Player:
     """Player that navigates the maze"""
 
+    __slots__ = ('tile_x', 'tile_y', 'tile_size', 'speed', 'color', 'sprite',
+                 'total_cost', 'exploration_cost', 'checkpoints_collected',
+                 'energy_limit', 'out_of_energy')
+
     def __init__(self, x, y, tile_size, sprite=None, color=BLUE, energy_limit=None):
         self.tile_x = x
         self.tile_y = y
@@ -106,15 +277,11 @@ class Player:
         new_x = self.tile_x + dx
         new_y = self.tile_y + dy
 
-        # Check bounds
-        if not (0 <= new_y < len(maze) and 0 <= new_x < len(maze[0])):
-            return 0
-
-        terrain = maze[new_y][new_x]
-
-        # Check if terrain is passable
-        if is_passable(terrain):
-            move_cost = get_terrain_cost(terrain)
+        # Bounds and passability in one lookup: the bitmap's padded
+        # border is always False, so off-grid steps fail the same check
+        # as walls (this runs on every keyboard and path-following move)
+        if _passable_bitmap(maze)[new_y + 1, new_x + 1]:
+            move_cost = COST_TABLE[maze[new_y, new_x]]
 
             # Check energy constraint
             if self.energy_limit is not None:
@@ -150,7 +317,7 @@ class Player:
 
     def is_at_goal(self, maze):
         """Check if player reached the goal"""
-        return maze[self.tile_y][self.tile_x] == TERRAIN_GOAL
+        return maze[self.tile_y, self.tile_x] == TERRAIN_GOAL
 
 
 def draw_maze_with_fog(screen, maze, tile_size, player, explored_tiles, vision_range=5, all_checkpoints=None, collected_checkpoints=None):
@@ -165,77 +332,57 @@ def draw_maze_with_fog(screen, maze, tile_size, player, explored_tiles, vision_r
     if collected_checkpoints is None:
         collected_checkpoints = set()
 
-    for y, row in enumerate(maze):
+    # This is the one per-tile Python loop left in the draw path, so
+    # bind the hot names to locals once and iterate plain lists
+    blit = screen.blit
+    draw_rect = pygame.draw.rect
+    tile_sprites = TILE_SPRITES
+    marker = checkpoint_tile_sprite
+    dim = fog_overlay
+    explored = explored_tiles
+    pending = all_checkpoints - collected_checkpoints
+    px = player.tile_x
+    py = player.tile_y
+
+    for y, row in enumerate(maze.tolist()):
         for x, cell in enumerate(row):
-            rect = pygame.Rect(x * tile_size, y * tile_size, tile_size, tile_size)
+            pos = (x * tile_size, y * tile_size)
 
             # Calculate distance from player (Manhattan distance)
-            distance = abs(x - player.tile_x) + abs(y - player.tile_y)
-            is_visible = distance <= vision_range
-            is_explored = (x, y) in explored_tiles
+            is_visible = abs(x - px) + abs(y - py) <= vision_range
+            is_explored = (x, y) in explored
 
             if is_visible or is_explored:
-                # Check if this position should show a checkpoint
-                should_show_checkpoint = (x, y) in all_checkpoints and (x, y) not in collected_checkpoints
-
-                # Draw the tile normally
-                if cell == TERRAIN_GRASS or cell == TERRAIN_CHECKPOINT:  # Grass - cost 1
-                    screen.blit(grass_sprite, rect)
-                    # Draw checkpoint if it should be shown
-                    if should_show_checkpoint:
-                        # Draw checkpoint marker (yellow star)
-                        overlay = pygame.Surface((tile_size, tile_size))
-                        overlay.fill(YELLOW)
-                        overlay.set_alpha(100)
-                        screen.blit(overlay, rect)
-                        # Draw star shape
-                        pygame.draw.circle(screen, YELLOW, rect.center, tile_size // 4, 3)
-                elif cell == TERRAIN_WALL:  # Wall - impassable
-                    screen.blit(wall_sprite, rect)
-                elif cell == TERRAIN_WATER:  # Water - cost 3
-                    screen.blit(water_sprite, rect)
-                elif cell == TERRAIN_MUD:  # Mud - cost 5
-                    screen.blit(mud_sprite, rect)
-                elif cell == TERRAIN_LAVA:  # Lava - impassable
-                    screen.blit(lava_sprite, rect)
-                elif cell == TERRAIN_START:  # Start - use grass with green overlay
-                    screen.blit(grass_sprite, rect)
-                    # Add green tint for start
-                    overlay = pygame.Surface((tile_size, tile_size))
-                    overlay.fill(GREEN)
-                    overlay.set_alpha(120)
-                    screen.blit(overlay, rect)
-                elif cell == TERRAIN_GOAL:  # Goal - use grass with red flag
-                    screen.blit(grass_sprite, rect)
-                    # Add red tint for goal
-                    overlay = pygame.Surface((tile_size, tile_size))
-                    overlay.fill(RED)
-                    overlay.set_alpha(120)
-                    screen.blit(overlay, rect)
-                    # Draw a small flag marker
-                    flag_points = [
-                        (rect.centerx, rect.top + 2),
-                        (rect.centerx, rect.bottom - 2),
-                    ]
-                    pygame.draw.line(screen, RED, flag_points[0], flag_points[1], 2)
-                    flag_tri = [
-                        (rect.centerx, rect.top + 2),
-                        (rect.centerx + 6, rect.top + 5),
-                        (rect.centerx, rect.top + 8),
-                    ]
-                    pygame.draw.polygon(screen, RED, flag_tri)
-                else:  # Fallback
-                    screen.blit(empty_sprite, rect)
+                # Uncollected checkpoints show their marker tile, every
+                # other cell comes straight from the sprite table
+                if (x, y) in pending:
+                    blit(marker, pos)
+                else:
+                    blit(tile_sprites[cell], pos)
 
                 # Dim previously explored but not currently visible tiles
                 if not is_visible and is_explored:
-                    fog_overlay = pygame.Surface((tile_size, tile_size))
-                    fog_overlay.fill(BLACK)
-                    fog_overlay.set_alpha(120)  # Semi-transparent black
-                    screen.blit(fog_overlay, rect)
+                    blit(dim, pos)
             else:
                 # Draw black fog for unexplored tiles
-                pygame.draw.rect(screen, BLACK, rect)
+                draw_rect(screen, BLACK,
+                          (pos[0], pos[1], tile_size, tile_size))
+
+
+# Pixel position of every tile in row-major order, cached per grid shape
+# so the blit sequence never recomputes x * tile_size / y * tile_size
+_pos_cache = {}
+
+
+def _tile_positions(width, height, tile_size):
+    key = (width, height, tile_size)
+    positions = _pos_cache.get(key)
+    if positions is None:
+        positions = _pos_cache[key] = [
+            (x * tile_size, y * tile_size)
+            for y in range(height) for x in range(width)
+        ]
+    return positions
 
 
 def draw_maze(screen, maze, tile_size, all_checkpoints=None, collected_checkpoints=None):
@@ -250,68 +397,48 @@ def draw_maze(screen, maze, tile_size, all_checkpoints=None, collected_checkpoin
     if collected_checkpoints is None:
         collected_checkpoints = set()
 
-    for y, row in enumerate(maze):
-        for x, cell in enumerate(row):
-            rect = pygame.Rect(x * tile_size, y * tile_size, tile_size, tile_size)
-
-            # Check if this position should show a checkpoint
-            should_show_checkpoint = (x, y) in all_checkpoints and (x, y) not in collected_checkpoints
-
-            if cell == TERRAIN_GRASS or cell == TERRAIN_CHECKPOINT:  # Grass - cost 1
-                screen.blit(grass_sprite, rect)
-                # Draw checkpoint if it should be shown
-                if should_show_checkpoint:
-                    # Draw checkpoint marker (yellow star)
-                    overlay = pygame.Surface((tile_size, tile_size))
-                    overlay.fill(YELLOW)
-                    overlay.set_alpha(100)
-                    screen.blit(overlay, rect)
-                    # Draw star shape
-                    pygame.draw.circle(screen, YELLOW, rect.center, tile_size // 4, 3)
-            elif cell == TERRAIN_WALL:  # Wall - impassable
-                screen.blit(wall_sprite, rect)
-            elif cell == TERRAIN_WATER:  # Water - cost 3
-                screen.blit(water_sprite, rect)
-            elif cell == TERRAIN_MUD:  # Mud - cost 5
-                screen.blit(mud_sprite, rect)
-            elif cell == TERRAIN_LAVA:  # Lava - impassable
-                screen.blit(lava_sprite, rect)
-            elif cell == TERRAIN_START:  # Start - use grass with green overlay
-                screen.blit(grass_sprite, rect)
-                # Add green tint for start
-                overlay = pygame.Surface((tile_size, tile_size))
-                overlay.fill(GREEN)
-                overlay.set_alpha(120)
-                screen.blit(overlay, rect)
-            elif cell == TERRAIN_GOAL:  # Goal - use grass with red flag
-                screen.blit(grass_sprite, rect)
-                # Add red tint for goal
-                overlay = pygame.Surface((tile_size, tile_size))
-                overlay.fill(RED)
-                overlay.set_alpha(120)
-                screen.blit(overlay, rect)
-                # Draw a small flag marker
-                flag_points = [
-                    (rect.centerx, rect.top + 2),
-                    (rect.centerx, rect.bottom - 2),
-                ]
-                pygame.draw.line(screen, RED, flag_points[0], flag_points[1], 2)
-                flag_tri = [
-                    (rect.centerx, rect.top + 2),
-                    (rect.centerx + 6, rect.top + 5),
-                    (rect.centerx, rect.top + 8),
-                ]
-                pygame.draw.polygon(screen, RED, flag_tri)
-            else:  # Fallback
-                screen.blit(empty_sprite, rect)
+    # Batch every tile into one blits call instead of ~one blit per tile.
+    # Cells come out as a flat Python list zipped against the precomputed
+    # pixel positions, and every entry copies a sub-rect of the shared
+    # tile atlas; uncollected checkpoints use the marker's atlas slot
+    height, width = maze.shape
+    atlas = TILE_ATLAS
+    rects = ATLAS_RECTS
+    cells = maze.ravel().tolist()
+    positions = _tile_positions(width, height, tile_size)
+    pending = all_checkpoints - collected_checkpoints
+    if pending:
+        blit_seq = [
+            (atlas, pos,
+             CHECKPOINT_ATLAS_RECT
+             if (pos[0] // tile_size, pos[1] // tile_size) in pending
+             else rects[cell])
+            for cell, pos in zip(cells, positions)
+        ]
+    else:
+        blit_seq = [(atlas, pos, rects[cell])
+                    for cell, pos in zip(cells, positions)]
+    screen.blits(blit_seq, doreturn=0)
+
+
+def build_maze_surface(maze, tile_size, all_checkpoints=None, collected_checkpoints=None):
+    """Render the full maze into an offscreen background surface
+
+    The maze only changes on regeneration or when a checkpoint is
+    collected, so the loop caches this surface and blits it each frame
+    in a single call instead of re-drawing every tile.
+    """
+    background = pygame.Surface((MAZE_DISPLAY_WIDTH, MAZE_DISPLAY_HEIGHT)).convert()
+    draw_maze(background, maze, tile_size, all_checkpoints, collected_checkpoints)
+    return background
 
 
 def draw_ui(screen, width, height, moves, total_cost, won, game_mode='explore', player=None, num_checkpoints=3, player_mode='solo', ai_agents=None, winner=None, fog_of_war=False, energy_constraint=False, fuel_limit=100, current_level=1, level_moves=0, player_collected_checkpoints=None, ai_collected_checkpoints=None, timer_enabled=False, time_remaining=0, time_limit=60, loser=None):
     """Draw the UI elements on the right side of the screen."""
-    font_title = pygame.font.Font(None, 48)
-    font_text = pygame.font.Font(None, 32)
-    font_small = pygame.font.Font(None, 28)
-    font_tiny = pygame.font.Font(None, 22)
+    font_title = FONT_TITLE
+    font_text = FONT_TEXT
+    font_small = FONT_SMALL
+    font_tiny = FONT_TINY
 
     if ai_agents is None:
         ai_agents = []
@@ -330,23 +457,23 @@ def draw_ui(screen, width, height, moves, total_cost, won, game_mode='explore',
     # Title
     y_pos = 50
     if game_mode == 'dynamic':
-        title_text = font_title.render("PROGRESSIVE", True, YELLOW)
+        title_text = _render_text(font_title, "PROGRESSIVE", YELLOW)
     else:
-        title_text = font_title.render("MAZE RUNNER", True, YELLOW)
+        title_text = _render_text(font_title, "MAZE RUNNER", YELLOW)
     title_rect = title_text.get_rect(centerx=ui_x_start + UI_WIDTH // 2, y=y_pos)
     screen.blit(title_text, title_rect)
 
     # Show level for dynamic mode
     if game_mode == 'dynamic':
         y_pos += 55
-        level_text = font_title.render(f"LEVEL {current_level}", True, CYAN)
+        level_text = _render_text(font_title, f"LEVEL {current_level}", CYAN)
         level_rect = level_text.get_rect(centerx=ui_x_start + UI_WIDTH // 2, y=y_pos)
         screen.blit(level_text, level_rect)
 
     # Show fog of war indicator if active
     if fog_of_war:
         y_pos += 60
-        fog_text = font_small.render("FOG OF WAR", True, CYAN)
+        fog_text = _render_text(font_small, "FOG OF WAR", CYAN)
         fog_rect = fog_text.get_rect(centerx=ui_x_start + UI_WIDTH // 2, y=y_pos)
         screen.blit(fog_text, fog_rect)
         y_pos -= 10  # Adjust spacing
@@ -354,28 +481,28 @@ def draw_ui(screen, width, height, moves, total_cost, won, game_mode='explore',
     # Competitive mode UI
     if player_mode == 'competitive':
         y_pos += 70
-        mode_text = font_small.render("COMPETITIVE MODE", True, RED)
+        mode_text = _render_text(font_small, "COMPETITIVE MODE", RED)
         mode_rect = mode_text.get_rect(centerx=ui_x_start + UI_WIDTH // 2, y=y_pos)
         screen.blit(mode_text, mode_rect)
 
         # Player stats
         y_pos += 50
-        player_label = font_text.render("You:", True, BLUE)
+        player_label = _render_text(font_text, "You:", BLUE)
         player_label_rect = player_label.get_rect(x=ui_x_start + 30, y=y_pos)
         screen.blit(player_label, player_label_rect)
 
         y_pos += 35
         if energy_constraint:
-            player_stats = font_small.render(f"Moves: {moves}  Energy: {total_cost}/{fuel_limit}", True, WHITE)
+            player_stats = _render_number(font_small, f"Moves: {moves}  Energy: {total_cost}/{fuel_limit}", WHITE)
         else:
-            player_stats = font_small.render(f"Moves: {moves}  Cost: {total_cost}", True, WHITE)
+            player_stats = _render_number(font_small, f"Moves: {moves}  Cost: {total_cost}", WHITE)
         player_stats_rect = player_stats.get_rect(x=ui_x_start + 50, y=y_pos)
         screen.blit(player_stats, player_stats_rect)
 
         # Checkpoint counter for player (only in multi-goal mode)
         if player_mode == "competitive" and game_mode == "multi-goal" and player_collected_checkpoints is not None:
             y_pos += 30
-            player_cp_text = font_tiny.render(f"Checkpoints: {len(player_collected_checkpoints)}/{num_checkpoints}", True, BLUE)
+            player_cp_text = _render_number(font_tiny, f"Checkpoints: {len(player_collected_checkpoints)}/{num_checkpoints}", BLUE)
             player_cp_rect = player_cp_text.get_rect(x=ui_x_start + 50, y=y_pos)
             screen.blit(player_cp_text, player_cp_rect)
 
@@ -383,27 +510,27 @@ def draw_ui(screen, width, height, moves, total_cost, won, game_mode='explore',
         y_pos += 50
         for ai in ai_agents:
             status = "FINISHED!" if ai.finished else "Running"
-            ai_label = font_text.render(f"{ai.name}:", True, ai.color)
+            ai_label = _render_text(font_text, f"{ai.name}:", ai.color)
             ai_label_rect = ai_label.get_rect(x=ui_x_start + 30, y=y_pos)
             screen.blit(ai_label, ai_label_rect)
 
             y_pos += 30
             if energy_constraint:
-                ai_stats = font_tiny.render(f"Moves: {ai.moves}  Energy: {ai.total_cost}/{fuel_limit}", True, WHITE)
+                ai_stats = _render_number(font_tiny, f"Moves: {ai.moves}  Energy: {ai.total_cost}/{fuel_limit}", WHITE)
             else:
-                ai_stats = font_tiny.render(f"Moves: {ai.moves}  Cost: {ai.total_cost}", True, WHITE)
+                ai_stats = _render_number(font_tiny, f"Moves: {ai.moves}  Cost: {ai.total_cost}", WHITE)
             ai_stats_rect = ai_stats.get_rect(x=ui_x_start + 50, y=y_pos)
             screen.blit(ai_stats, ai_stats_rect)
 
             # Checkpoint counter for AI (only in multi-goal mode)
             if player_mode == "competitive" and game_mode == "multi-goal" and ai_collected_checkpoints is not None:
                 y_pos += 25
-                ai_cp_text = font_tiny.render(f"Checkpoints: {len(ai_collected_checkpoints)}/{num_checkpoints}", True, RED)
+                ai_cp_text = _render_number(font_tiny, f"Checkpoints: {len(ai_collected_checkpoints)}/{num_checkpoints}", RED)
                 ai_cp_rect = ai_cp_text.get_rect(x=ui_x_start + 50, y=y_pos)
                 screen.blit(ai_cp_text, ai_cp_rect)
 
             y_pos += 25
-            ai_status = font_tiny.render(status, True, GREEN if ai.finished else GRAY)
+            ai_status = _render_text(font_tiny, status, GREEN if ai.finished else GRAY)
             ai_status_rect = ai_status.get_rect(x=ui_x_start + 50, y=y_pos)
             screen.blit(ai_status, ai_status_rect)
 
@@ -415,10 +542,10 @@ def draw_ui(screen, width, height, moves, total_cost, won, game_mode='explore',
             if winner == "No one":
                 # Draw or no winner
                 winner_color = GRAY
-                win_text = font_title.render("NO ONE WINS!", True, winner_color)
+                win_text = _render_text(font_title, "NO ONE WINS!", winner_color)
             else:
                 winner_color = BLUE if winner == "Player" else RED
-                win_text = font_title.render(f"{winner} WINS!", True, winner_color)
+                win_text = _render_text(font_title, f"{winner} WINS!", winner_color)
             win_rect = win_text.get_rect(centerx=ui_x_start + UI_WIDTH // 2, y=y_pos)
             screen.blit(win_text, win_rect)
             y_pos += 70
@@ -426,7 +553,7 @@ def draw_ui(screen, width, height, moves, total_cost, won, game_mode='explore',
         # Timer display for competitive mode (if timer is enabled)
         if timer_enabled and not won:
             y_pos += 20
-            timer_label = font_text.render("Time Remaining:", True, WHITE)
+            timer_label = _render_text(font_text, "Time Remaining:", WHITE)
             timer_label_rect = timer_label.get_rect(centerx=ui_x_start + UI_WIDTH // 2, y=y_pos)
             screen.blit(timer_label, timer_label_rect)
 
@@ -442,7 +569,7 @@ def draw_ui(screen, width, height, moves, total_cost, won, game_mode='explore',
 
             minutes = int(time_remaining // 60)
             seconds = int(time_remaining % 60)
-            timer_text = font_title.render(f"{minutes}:{seconds:02d}", True, timer_color)
+            timer_text = _render_number(font_title, f"{minutes}:{seconds:02d}", timer_color)
             timer_rect = timer_text.get_rect(centerx=ui_x_start + UI_WIDTH // 2, y=y_pos)
             screen.blit(timer_text, timer_rect)
 
@@ -454,51 +581,51 @@ def draw_ui(screen, width, height, moves, total_cost, won, game_mode='explore',
         # Show different stats for dynamic mode (progressive levels)
         if game_mode == 'dynamic':
             # Total moves across all levels
-            moves_label = font_text.render("Total Moves:", True, WHITE)
+            moves_label = _render_text(font_text, "Total Moves:", WHITE)
             moves_label_rect = moves_label.get_rect(centerx=ui_x_start + UI_WIDTH // 2, y=y_pos)
             screen.blit(moves_label, moves_label_rect)
 
             y_pos += 45
-            moves_text = font_title.render(str(moves), True, GREEN)
+            moves_text = _render_number(font_title, str(moves), GREEN)
             moves_rect = moves_text.get_rect(centerx=ui_x_start + UI_WIDTH // 2, y=y_pos)
             screen.blit(moves_text, moves_rect)
 
             # Current level moves
             y_pos += 60
-            level_moves_label = font_small.render("Current Level:", True, WHITE)
+            level_moves_label = _render_text(font_small, "Current Level:", WHITE)
             level_moves_label_rect = level_moves_label.get_rect(centerx=ui_x_start + UI_WIDTH // 2, y=y_pos)
             screen.blit(level_moves_label, level_moves_label_rect)
 
             y_pos += 35
-            level_moves_text = font_text.render(str(level_moves), True, YELLOW)
+            level_moves_text = _render_number(font_text, str(level_moves), YELLOW)
             level_moves_rect = level_moves_text.get_rect(centerx=ui_x_start + UI_WIDTH // 2, y=y_pos)
             screen.blit(level_moves_text, level_moves_rect)
         else:
             # Normal mode - just show moves
-            moves_label = font_text.render("Moves:", True, WHITE)
+            moves_label = _render_text(font_text, "Moves:", WHITE)
             moves_label_rect = moves_label.get_rect(centerx=ui_x_start + UI_WIDTH // 2, y=y_pos)
             screen.blit(moves_label, moves_label_rect)
 
             y_pos += 45
-            moves_text = font_title.render(str(moves), True, GREEN)
+            moves_text = _render_number(font_title, str(moves), GREEN)
             moves_rect = moves_text.get_rect(centerx=ui_x_start + UI_WIDTH // 2, y=y_pos)
             screen.blit(moves_text, moves_rect)
 
         # Total cost
         y_pos += 70
-        cost_label = font_text.render("Total Cost:", True, WHITE)
+        cost_label = _render_text(font_text, "Total Cost:", WHITE)
         cost_label_rect = cost_label.get_rect(centerx=ui_x_start + UI_WIDTH // 2, y=y_pos)
         screen.blit(cost_label, cost_label_rect)
 
         y_pos += 45
-        cost_text = font_title.render(str(total_cost), True, YELLOW)
+        cost_text = _render_number(font_title, str(total_cost), YELLOW)
         cost_rect = cost_text.get_rect(centerx=ui_x_start + UI_WIDTH // 2, y=y_pos)
         screen.blit(cost_text, cost_rect)
 
         # Energy display (if energy constraint is enabled)
         if energy_constraint and player:
             y_pos += 70
-            energy_label = font_text.render("Energy Remaining:", True, WHITE)
+            energy_label = _render_text(font_text, "Energy Remaining:", WHITE)
             energy_label_rect = energy_label.get_rect(centerx=ui_x_start + UI_WIDTH // 2, y=y_pos)
             screen.blit(energy_label, energy_label_rect)
 
@@ -514,14 +641,14 @@ def draw_ui(screen, width, height, moves, total_cost, won, game_mode='explore',
             else:
                 energy_color = RED
 
-            energy_text = font_title.render(f"{remaining_energy}/{fuel_limit}", True, energy_color)
+            energy_text = _render_number(font_title, f"{remaining_energy}/{fuel_limit}", energy_color)
             energy_rect = energy_text.get_rect(centerx=ui_x_start + UI_WIDTH // 2, y=y_pos)
             screen.blit(energy_text, energy_rect)
 
         # Timer display (if timer is enabled)
         if timer_enabled:
             y_pos += 70
-            timer_label = font_text.render("Time Remaining:", True, WHITE)
+            timer_label = _render_text(font_text, "Time Remaining:", WHITE)
             timer_label_rect = timer_label.get_rect(centerx=ui_x_start + UI_WIDTH // 2, y=y_pos)
             screen.blit(timer_label, timer_label_rect)
 
@@ -537,7 +664,7 @@ def draw_ui(screen, width, height, moves, total_cost, won, game_mode='explore',
 
             minutes = int(time_remaining // 60)
             seconds = int(time_remaining % 60)
-            timer_text = font_title.render(f"{minutes}:{seconds:02d}", True, timer_color)
+            timer_text = _render_number(font_title, f"{minutes}:{seconds:02d}", timer_color)
             timer_rect = timer_text.get_rect(centerx=ui_x_start + UI_WIDTH // 2, y=y_pos)
             screen.blit(timer_text, timer_rect)
 
@@ -546,12 +673,12 @@ def draw_ui(screen, width, height, moves, total_cost, won, game_mode='explore',
             # Solo mode - show checkpoints in UI panel
             if player_mode != 'competitive':
                 y_pos += 70
-                checkpoint_label = font_text.render("Checkpoints:", True, WHITE)
+                checkpoint_label = _render_text(font_text, "Checkpoints:", WHITE)
                 checkpoint_label_rect = checkpoint_label.get_rect(centerx=ui_x_start + UI_WIDTH // 2, y=y_pos)
                 screen.blit(checkpoint_label, checkpoint_label_rect)
 
                 y_pos += 45
-                checkpoint_text = font_title.render(f"{player.checkpoints_collected}/{num_checkpoints}", True, (255, 200, 0))
+                checkpoint_text = _render_number(font_title, f"{player.checkpoints_collected}/{num_checkpoints}", (255, 200, 0))
                 checkpoint_rect = checkpoint_text.get_rect(centerx=ui_x_start + UI_WIDTH // 2, y=y_pos)
                 screen.blit(checkpoint_text, checkpoint_rect)
 
@@ -563,23 +690,23 @@ def draw_ui(screen, width, height, moves, total_cost, won, game_mode='explore',
         # Check if player actually won or lost (e.g., time expired)
         if loser == "Player":
             # Player lost (time ran out, out of energy, etc.)
-            lose_text = font_title.render("GAME OVER!", True, RED)
+            lose_text = _render_text(font_title, "GAME OVER!", RED)
             lose_rect = lose_text.get_rect(centerx=ui_x_start + UI_WIDTH // 2, y=y_pos)
             screen.blit(lose_text, lose_rect)
         else:
             # Player actually won
-            win_text = font_title.render("YOU WIN!", True, YELLOW)
+            win_text = _render_text(font_title, "YOU WIN!", YELLOW)
             win_rect = win_text.get_rect(centerx=ui_x_start + UI_WIDTH // 2, y=y_pos)
             screen.blit(win_text, win_rect)
 
         y_pos += 60
-        restart_text = font_text.render("Press R to restart", True, WHITE)
+        restart_text = _render_text(font_text, "Press R to restart", WHITE)
         restart_rect = restart_text.get_rect(centerx=ui_x_start + UI_WIDTH // 2, y=y_pos)
         screen.blit(restart_text, restart_rect)
     elif not won:
         pass
         # # Controls
-        # controls_title = font_text.render("Controls:", True, WHITE)
+        # controls_title = _render_text(font_text, "Controls:", WHITE)
         # controls_rect = controls_title.get_rect(centerx=ui_x_start + UI_WIDTH // 2, y=y_pos)
         # screen.blit(controls_title, controls_rect)
 
@@ -590,7 +717,7 @@ def draw_ui(screen, width, height, moves, total_cost, won, game_mode='explore',
         #     "ESC - Return to Menu"
         # ]
         # for control in controls:
-        #     control_text = font_text.render(control, True, WHITE)
+        #     control_text = _render_text(font_text, control, WHITE)
         #     control_rect = control_text.get_rect(centerx=ui_x_start + UI_WIDTH // 2, y=y_pos)
         #     screen.blit(control_text, control_rect)
         #     y_pos += 40
@@ -598,12 +725,7 @@ def draw_ui(screen, width, height, moves, total_cost, won, game_mode='explore',
 
 def find_start_position(maze):
     """Find the start position (marked as TERRAIN_START) in the maze"""
-    for y, row in enumerate(maze):
-        for x, cell in enumerate(row):
-            if cell == TERRAIN_START:
-                return x, y
-    # Default to (1, 1) if no start found
-    return 1, 1
+    return maze_kernels.find_marker(maze, TERRAIN_START)
 
 
 def generate_progressive_maze(width, height, goal_placement, level):
@@ -619,68 +741,68 @@ def generate_progressive_maze(width, height, goal_placement, level):
         Generated maze with difficulty scaled to level
     """
     # Generate base maze
-    maze = generate_maze(width, height, goal_placement, 'explore', 0)
+    maze = np.asarray(generate_maze(width, height, goal_placement, 'explore', 0),
+                      dtype=np.uint8)
 
     # Clear all terrain variety from base maze (we'll add it back based on level)
-    for y in range(1, height - 1):
-        for x in range(1, width - 1):
-            if maze[y][x] in [TERRAIN_WATER, TERRAIN_MUD, TERRAIN_LAVA]:
-                maze[y][x] = TERRAIN_GRASS
+    interior = maze[1:height - 1, 1:width - 1]
+    interior[np.isin(interior, (TERRAIN_WATER, TERRAIN_MUD, TERRAIN_LAVA))] = TERRAIN_GRASS
 
     # Level-based terrain replacement
-    # Higher levels have more dangerous terrain
-    grass_tiles = []
-    for y in range(1, height - 1):
-        for x in range(1, width - 1):
-            if maze[y][x] == TERRAIN_GRASS:
-                # Don't modify start and goal areas
-                if not (x == 1 and y == 1):  # Not start
-                    goal_x = width - 2 if goal_placement == 'corner' else width // 2
-                    goal_y = height - 2 if goal_placement == 'corner' else height // 2
-                    if not (abs(x - goal_x) <= 2 and abs(y - goal_y) <= 2):  # Not near goal
-                        grass_tiles.append((x, y))
-
-    if not grass_tiles:
+    # Higher levels have more dangerous terrain; candidate tiles are the
+    # interior grass cells away from the start and goal areas, found with
+    # one vectorized scan instead of a Python double loop
+    goal_x = width - 2 if goal_placement == 'corner' else width // 2
+    goal_y = height - 2 if goal_placement == 'corner' else height // 2
+    ys, xs = np.where(maze == TERRAIN_GRASS)
+    keep = ((xs > 0) & (xs < width - 1) & (ys > 0) & (ys < height - 1)
+            & ~((xs == 1) & (ys == 1))
+            & ~((np.abs(xs - goal_x) <= 2) & (np.abs(ys - goal_y) <= 2)))
+    xs = xs[keep]
+    ys = ys[keep]
+
+    if not xs.size:
         return maze
 
     # Determine how many tiles to convert based on level
     # Level 1: 5% of grass, Level 5: 25%, Level 10+: 40%
     conversion_rate = min(0.05 + (level - 1) * 0.035, 0.40)
-    num_conversions = int(len(grass_tiles) * conversion_rate)
+    num_conversions = min(int(xs.size * conversion_rate), int(xs.size))
 
-    # Randomly select tiles to convert
+    # Sample candidate indices directly instead of materializing every
+    # candidate as an (x, y) tuple just to throw most of them away
     import random
-    tiles_to_convert = random.sample(grass_tiles, min(num_conversions, len(grass_tiles)))
+    chosen = random.sample(range(int(xs.size)), num_conversions)
 
-    for x, y in tiles_to_convert:
+    for x, y in zip(xs[chosen].tolist(), ys[chosen].tolist()):
         # Obstacle distribution based on level
         rand = random.random()
 
         if level == 1:
             # Level 1: Only water (cost 3)
-            maze[y][x] = TERRAIN_WATER
+            maze[y, x] = TERRAIN_WATER
         elif level == 2:
             # Level 2: Water and some mud
             if rand < 0.7:
-                maze[y][x] = TERRAIN_WATER
+                maze[y, x] = TERRAIN_WATER
             else:
-                maze[y][x] = TERRAIN_MUD
+                maze[y, x] = TERRAIN_MUD
         elif level == 3:
             # Level 3: More mud appears
             if rand < 0.5:
-                maze[y][x] = TERRAIN_WATER
+                maze[y, x] = TERRAIN_WATER
             else:
-                maze[y][x] = TERRAIN_MUD
+                maze[y, x] = TERRAIN_MUD
         elif level >= 4:
             # Level 4+: Lava introduced (impassable)
             lava_chance = min(0.15 + (level - 4) * 0.05, 0.30)  # 15% at level 4, up to 30% at level 7+
 
             if rand < lava_chance:
-                maze[y][x] = TERRAIN_LAVA
+                maze[y, x] = TERRAIN_LAVA
             elif rand < 0.5 + lava_chance / 2:
-                maze[y][x] = TERRAIN_MUD
+                maze[y, x] = TERRAIN_MUD
             else:
-                maze[y][x] = TERRAIN_WATER
+                maze[y, x] = TERRAIN_WATER
 
     return maze
 
@@ -700,24 +822,24 @@ def start(goal_placement='corner', game_mode='explore', num_checkpoints=5, playe
         timer_enabled: Enable time limit
         time_limit: Time limit in seconds
     """
+    # Compile the maze-scan kernels up front so the first regen isn't
+    # hit by JIT latency
+    maze_kernels.warmup()
+
     # Generate maze (use progressive generation for dynamic mode starting at level 1)
     if game_mode == 'dynamic':
         maze = generate_progressive_maze(MAZE_WIDTH, MAZE_HEIGHT, goal_placement, 1)
     else:
-        maze = generate_maze(MAZE_WIDTH, MAZE_HEIGHT, goal_placement, game_mode, num_checkpoints)
+        maze = np.asarray(
+            generate_maze(MAZE_WIDTH, MAZE_HEIGHT, goal_placement, game_mode, num_checkpoints),
+            dtype=np.uint8)
 
     # Find start position and create player
     start_x, start_y = find_start_position(maze)
 
-    # Create player sprite (a small character on grass)
-    player_sprite = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
-    # Draw a simple character (circle with outline)
-    pygame.draw.circle(player_sprite, BLUE, (TILE_SIZE // 2, TILE_SIZE // 2), TILE_SIZE // 3)
-    pygame.draw.circle(player_sprite, WHITE, (TILE_SIZE // 2, TILE_SIZE // 2), TILE_SIZE // 3, 2)
-
     # Set energy limit if constraint is enabled
     energy_limit = fuel_limit if energy_constraint else None
-    player = Player(start_x, start_y, TILE_SIZE, player_sprite, BLUE, energy_limit)
+    player = Player(start_x, start_y, TILE_SIZE, PLAYER_SPRITE, BLUE, energy_limit)
 
     # Create AI agents in competitive mode
     ai_agents = []
@@ -732,14 +854,10 @@ def start(goal_placement='corner', game_mode='explore', num_checkpoints=5, playe
 
         ai_agent = AIAgent(ai_x, ai_y, TILE_SIZE, ai_name, ai_color, energy_limit)
 
-        # In multi-goal mode, find all checkpoints and initialize AI's checkpoint list
+        # In multi-goal mode, find all checkpoints and initialize AI's checkpoint set
         if game_mode == 'multi-goal':
-            checkpoints = []
-            for y in range(len(maze)):
-                for x in range(len(maze[0])):
-                    if maze[y][x] == TERRAIN_CHECKPOINT:
-                        checkpoints.append((x, y))
-            ai_agent.remaining_checkpoints = checkpoints.copy()
+            cp_ys, cp_xs = np.where(maze == TERRAIN_CHECKPOINT)
+            ai_agent.remaining_checkpoints = set(zip(cp_xs.tolist(), cp_ys.tolist()))
 
         ai_agent.calculate_path(maze, fog_of_war)  # Calculate initial path with fog of war awareness
         ai_agents.append(ai_agent)
@@ -762,6 +880,12 @@ def loop(maze, player, input_controller, moves, won, goal_placement, game_mode='
     if ai_agents is None:
         ai_agents = []
 
+    # Let SDL drop events the game never reads (mouse motion, window
+    # focus chatter, ...) before they get wrapped into Python objects;
+    # delivery is restored to the default set when returning to the menu
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed((pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN))
+
     # Progressive levels for dynamic mode
     current_level = 1
     level_moves = 0  # Moves in current level
@@ -775,24 +899,18 @@ def loop(maze, player, input_controller, moves, won, goal_placement, game_mode='
     player_collected_checkpoints = set()  # Checkpoints collected by player
     ai_collected_checkpoints = set()  # Checkpoints collected by AI
     if game_mode == 'multi-goal':
-        for y in range(len(maze)):
-            for x in range(len(maze[0])):
-                if maze[y][x] == TERRAIN_CHECKPOINT:
-                    all_checkpoints.add((x, y))
+        cp_ys, cp_xs = np.where(maze == TERRAIN_CHECKPOINT)
+        all_checkpoints.update(zip(cp_xs.tolist(), cp_ys.tolist()))
 
     # Track explored tiles for fog of war (stores all tiles the player has seen)
     explored_tiles = set()
     if fog_of_war:
         # Start with player's initial vision
-        vision_range = 5  # Player can see 5 tiles in each direction
-        for dy in range(-vision_range, vision_range + 1):
-            for dx in range(-vision_range, vision_range + 1):
-                tile_x = player.tile_x + dx
-                tile_y = player.tile_y + dy
-                if 0 <= tile_x < len(maze[0]) and 0 <= tile_y < len(maze):
-                    # Use Manhattan distance for vision
-                    if abs(dx) + abs(dy) <= vision_range:
-                        explored_tiles.add((tile_x, tile_y))
+        for dx, dy in VISION_OFFSETS:
+            tile_x = player.tile_x + dx
+            tile_y = player.tile_y + dy
+            if 0 <= tile_x < maze.shape[1] and 0 <= tile_y < maze.shape[0]:
+                explored_tiles.add((tile_x, tile_y))
 
     # For visualizing AI moves
     ai_animation_queue = []  # Queue of AI agents to animate
@@ -805,6 +923,36 @@ def loop(maze, player, input_controller, moves, won, goal_placement, game_mode='
     start_time = pygame.time.get_ticks() if timer_enabled else None
     time_expired = False
 
+    # Cached maze background (rebuilt when the maze or the set of visible
+    # checkpoints changes)
+    maze_background = None
+    background_maze = None
+    background_collected = None
+
+    # Dirty-rect bookkeeping: on frames where only the player/AI sprites
+    # and the UI panel changed, push just those regions to the display
+    # instead of flipping the whole framebuffer
+    ui_panel_rect = pygame.Rect(MAZE_DISPLAY_WIDTH, 0, UI_WIDTH, TOTAL_WINDOW_HEIGHT)
+    prev_dynamic_rects = []
+    prev_path_active = False
+    prev_won = won
+
+    # Idle-frame detection: while nothing has moved and nothing is
+    # animating, the previous frame is still valid and drawing is skipped
+    # altogether. Events, AI animation and path-following moves mark the
+    # state dirty again.
+    state_dirty = True
+    time_remaining = 0
+
+    # Held-key repeat state for continuous movement
+    held_key = None
+    held_since_ms = 0
+
+    # One clear at entry wipes whatever the menu left behind; after that
+    # every rendered frame fully repaints the maze area and the UI panel,
+    # so the per-frame full-screen fill would be redundant bandwidth
+    screen.fill(BLACK)
+
     while run:
         clock.tick(60)  # 60 FPS
 
@@ -849,6 +997,7 @@ def loop(maze, player, input_controller, moves, won, goal_placement, game_mode='
 
         # Process AI animation queue (in competitive mode)
         if player_mode == 'competitive' and ai_animation_queue and not won:
+            state_dirty = True
             ai_animation_delay += 1
 
             # Make AI moves at a slower pace for visibility
@@ -858,11 +1007,9 @@ def loop(maze, player, input_controller, moves, won, goal_placement, game_mode='
                 if ai_animation_queue:
                     current_ai = ai_animation_queue[0]
 
-                    # Only recalculate path if needed (empty, blocked, or checkpoint collected)
-                    should_recalculate = False
-                    if not current_ai.path:
-                        should_recalculate = True
-                    elif fog_of_war:
+                    # Only recalculate path if needed (empty, invalidated, or blocked)
+                    should_recalculate = current_ai.needs_replan()
+                    if not should_recalculate and fog_of_war:
                         # Check if next tile in path is still valid (not blocked/unexplored)
                         next_tile = current_ai.path[0]
                         if next_tile not in current_ai.known_maze:
@@ -912,10 +1059,14 @@ def loop(maze, player, input_controller, moves, won, goal_placement, game_mode='
                         ai_animation_queue.pop(0)
                         ai_moves_remaining = 0
 
-        # Update mouse movement (if mouse is held)
-        if not won and not ai_animation_queue:  # Don't allow player movement during AI animation
-            mouse_move_cost = input_controller.update_mouse_movement(player, maze, delay_frames=5)
+        # Update mouse movement (only while a path is being followed;
+        # the method gates its own step cadence, but most frames have no
+        # active path and can skip the dispatch entirely)
+        if (not won and not ai_animation_queue
+                and input_controller.pathfinding_active):  # No player movement during AI animation
+            mouse_move_cost = input_controller.update_mouse_movement(player, maze, delay_ms=50)
             if mouse_move_cost > 0:
+                state_dirty = True
                 moves += 1
                 player_move_counter += 1  # Increment turn counter
 
@@ -936,7 +1087,7 @@ def loop(maze, player, input_controller, moves, won, goal_placement, game_mode='
                     moves += 1
 
                 # Multi-goal mode: Check if landed on checkpoint
-                if game_mode == 'multi-goal' and maze[player.tile_y][player.tile_x] == TERRAIN_CHECKPOINT:
+                if game_mode == 'multi-goal' and maze[player.tile_y, player.tile_x] == TERRAIN_CHECKPOINT:
                     player.checkpoints_collected += 1
                     # Don't reset cost - keep accumulating
                     # player.exploration_cost += player.total_cost
@@ -1015,7 +1166,7 @@ def loop(maze, player, input_controller, moves, won, goal_placement, game_mode='
                                 ai.tile_x = start_x
                                 ai.tile_y = start_y
                                 ai.finished = False
-                                ai.path = []
+                                ai.path.clear()
                                 ai.calculate_path(maze, fog_of_war)
                             # Clear AI animation queue
                             ai_animation_queue.clear()
@@ -1025,14 +1176,11 @@ def loop(maze, player, input_controller, moves, won, goal_placement, game_mode='
                         # Reset explored tiles for fog of war
                         if fog_of_war:
                             explored_tiles.clear()
-                            vision_range = 5
-                            for dy in range(-vision_range, vision_range + 1):
-                                for dx in range(-vision_range, vision_range + 1):
-                                    tile_x = player.tile_x + dx
-                                    tile_y = player.tile_y + dy
-                                    if 0 <= tile_x < len(maze[0]) and 0 <= tile_y < len(maze):
-                                        if abs(dx) + abs(dy) <= vision_range:
-                                            explored_tiles.add((tile_x, tile_y))
+                            for dx, dy in VISION_OFFSETS:
+                                tile_x = player.tile_x + dx
+                                tile_y = player.tile_y + dy
+                                if 0 <= tile_x < maze.shape[1] and 0 <= tile_y < maze.shape[0]:
+                                    explored_tiles.add((tile_x, tile_y))
 
                         print(f"→ Starting Level {current_level}")
                     else:
@@ -1043,68 +1191,113 @@ def loop(maze, player, input_controller, moves, won, goal_placement, game_mode='
                         print(f"Moves: {moves}")
                         print(f"Total Cost: {player.total_cost}\n")
 
-        # Fill background
-        screen.fill(BLACK)
-
-        # Update explored tiles if fog of war is enabled
-        if fog_of_war:
-            vision_range = 5
-            for dy in range(-vision_range, vision_range + 1):
-                for dx in range(-vision_range, vision_range + 1):
+        # Skip drawing entirely on idle frames: the previous frame is
+        # still on screen and nothing needs repainting
+        render_frame = (state_dirty or bool(ai_animation_queue)
+                        or timer_enabled or input_controller.pathfinding_active)
+        background_rebuilt = False
+        if render_frame:
+            state_dirty = False
+
+            # Update explored tiles if fog of war is enabled
+            if fog_of_war:
+                for dx, dy in VISION_OFFSETS:
                     tile_x = player.tile_x + dx
                     tile_y = player.tile_y + dy
-                    if 0 <= tile_x < len(maze[0]) and 0 <= tile_y < len(maze):
-                        # Use Manhattan distance for vision
-                        if abs(dx) + abs(dy) <= vision_range:
-                            explored_tiles.add((tile_x, tile_y))
-
-        # Draw maze (with or without fog of war)
-        # In competitive multi-goal mode, only hide checkpoints collected by BOTH player and AI
-        if game_mode == 'multi-goal' and player_mode == 'competitive':
-            # Checkpoint is hidden only if both player and AI collected it
-            collected_checkpoints = player_collected_checkpoints & ai_collected_checkpoints
-        elif game_mode == 'multi-goal':
-            # Solo mode: hide checkpoints collected by player
-            collected_checkpoints = player_collected_checkpoints
-        else:
-            # Non multi-goal mode
-            collected_checkpoints = set()
-
-        if fog_of_war:
-            draw_maze_with_fog(screen, maze, TILE_SIZE, player, explored_tiles, all_checkpoints=all_checkpoints, collected_checkpoints=collected_checkpoints)
-        else:
-            draw_maze(screen, maze, TILE_SIZE, all_checkpoints=all_checkpoints, collected_checkpoints=collected_checkpoints)
-
-        # Draw path visualization (if mouse is held)
-        if fog_of_war:
-            input_controller.draw_path(screen, TILE_SIZE, player, explored_tiles)
-        else:
-            input_controller.draw_path(screen, TILE_SIZE)
-
-        # Draw AI agents and their paths (in competitive mode)
-        if player_mode == 'competitive':
-            for ai in ai_agents:
-                # Don't draw the AI's path (hide their strategy)
-                # if not ai.finished:
-                #     ai.draw_path(screen, TILE_SIZE)
-                ai.draw(screen)
-
-        # Draw player
-        player.draw(screen)
+                    if 0 <= tile_x < maze.shape[1] and 0 <= tile_y < maze.shape[0]:
+                        explored_tiles.add((tile_x, tile_y))
 
-        # Calculate time remaining for display
-        if timer_enabled:
-            elapsed_time = (pygame.time.get_ticks() - start_time) / 1000
-            time_remaining = max(0, time_limit - elapsed_time)
-        else:
-            time_remaining = 0
+            # Draw maze (with or without fog of war)
+            # In competitive multi-goal mode, only hide checkpoints collected by BOTH player and AI
+            if game_mode == 'multi-goal' and player_mode == 'competitive':
+                # Checkpoint is hidden only if both player and AI collected it
+                collected_checkpoints = player_collected_checkpoints & ai_collected_checkpoints
+            elif game_mode == 'multi-goal':
+                # Solo mode: hide checkpoints collected by player
+                collected_checkpoints = player_collected_checkpoints
+            else:
+                # Non multi-goal mode
+                collected_checkpoints = set()
 
-        # Draw UI (pass appropriate moves count based on game mode)
-        display_moves = total_moves if game_mode == 'dynamic' else moves
-        draw_ui(screen, TOTAL_WINDOW_WIDTH, TOTAL_WINDOW_HEIGHT, display_moves, player.total_cost, won, game_mode, player, num_checkpoints, player_mode, ai_agents, winner, fog_of_war, energy_constraint, fuel_limit, current_level, level_moves, player_collected_checkpoints, ai_collected_checkpoints, timer_enabled, time_remaining, time_limit, loser)
+            if fog_of_war:
+                draw_maze_with_fog(screen, maze, TILE_SIZE, player, explored_tiles, all_checkpoints=all_checkpoints, collected_checkpoints=collected_checkpoints)
+            else:
+                # Blit the cached background, rebuilding it only when the maze
+                # was regenerated or a checkpoint's visibility changed
+                if (maze_background is None or background_maze is not maze
+                        or background_collected != collected_checkpoints):
+                    maze_background = build_maze_surface(maze, TILE_SIZE, all_checkpoints, collected_checkpoints)
+                    background_maze = maze
+                    background_collected = set(collected_checkpoints)
+                    background_rebuilt = True
+                screen.blit(maze_background, (0, 0))
+
+            # Draw path visualization (if mouse is held)
+            if fog_of_war:
+                input_controller.draw_path(screen, TILE_SIZE, player, explored_tiles)
+            else:
+                input_controller.draw_path(screen, TILE_SIZE)
+
+            # Draw AI agents and their paths (in competitive mode)
+            if player_mode == 'competitive':
+                for ai in ai_agents:
+                    # Don't draw the AI's path (hide their strategy)
+                    # if not ai.finished:
+                    #     ai.draw_path(screen, TILE_SIZE)
+                    ai.draw(screen)
+
+            # Draw player
+            player.draw(screen)
+
+            # Record the tiles the sprites were drawn on. Event handling
+            # below can move entities after the backbuffer is painted, so
+            # presentation must push these drawn positions, not wherever
+            # the entities are by the end of the frame
+            drawn_rects = [pygame.Rect(player.tile_x * TILE_SIZE,
+                                       player.tile_y * TILE_SIZE,
+                                       TILE_SIZE, TILE_SIZE)]
+            if player_mode == 'competitive':
+                for ai in ai_agents:
+                    drawn_rects.append(pygame.Rect(ai.tile_x * TILE_SIZE,
+                                                   ai.tile_y * TILE_SIZE,
+                                                   TILE_SIZE, TILE_SIZE))
+
+            # Calculate time remaining for display
+            if timer_enabled:
+                elapsed_time = (pygame.time.get_ticks() - start_time) / 1000
+                time_remaining = max(0, time_limit - elapsed_time)
+            else:
+                time_remaining = 0
+
+            # Draw UI (pass appropriate moves count based on game mode)
+            display_moves = total_moves if game_mode == 'dynamic' else moves
+            draw_ui(screen, TOTAL_WINDOW_WIDTH, TOTAL_WINDOW_HEIGHT, display_moves, player.total_cost, won, game_mode, player, num_checkpoints, player_mode, ai_agents, winner, fog_of_war, energy_constraint, fuel_limit, current_level, level_moves, player_collected_checkpoints, ai_collected_checkpoints, timer_enabled, time_remaining, time_limit, loser)
+
+        # Continuous movement: holding a movement key repeats the move at
+        # a fixed cadence instead of relying on OS key repeat. The repeat
+        # is injected as a synthetic KEYDOWN so the handler below keeps
+        # all move bookkeeping in one place; the initial press still
+        # moves instantly through its real event.
+        if not won and not ai_animation_queue:
+            pressed = pygame.key.get_pressed()
+            for key in KEY_DIR:
+                if pressed[key]:
+                    now = pygame.time.get_ticks()
+                    if key != held_key:
+                        held_key = key
+                        held_since_ms = now
+                    elif now - held_since_ms >= KEY_REPEAT_MS:
+                        held_since_ms = now
+                        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key))
+                    break
+            else:
+                held_key = None
 
         # Handle events
         for event in pygame.event.get():
+            # Any input can change game state, so the next frame redraws
+            state_dirty = True
+
             if event.type == pygame.QUIT:
                 run = False
 
@@ -1134,7 +1327,7 @@ def loop(maze, player, input_controller, moves, won, goal_placement, game_mode='
                         if not ai.finished and not ai.out_of_energy and ai not in ai_animation_queue:
                             # Just add to queue, path will be calculated when AI moves
                             ai_animation_queue.append(ai)                    # Multi-goal mode: Check if landed on checkpoint
-                    if game_mode == 'multi-goal' and maze[player.tile_y][player.tile_x] == TERRAIN_CHECKPOINT:
+                    if game_mode == 'multi-goal' and maze[player.tile_y, player.tile_x] == TERRAIN_CHECKPOINT:
                         player.checkpoints_collected += 1
                         # Don't reset cost - keep accumulating
                         # player.exploration_cost += player.total_cost
@@ -1215,7 +1408,7 @@ def loop(maze, player, input_controller, moves, won, goal_placement, game_mode='
                                     ai.tile_x = start_x
                                     ai.tile_y = start_y
                                     ai.finished = False
-                                    ai.path = []
+                                    ai.path.clear()
                                     ai.calculate_path(maze, fog_of_war)
                                 # Clear AI animation queue
                                 ai_animation_queue.clear()
@@ -1225,14 +1418,11 @@ def loop(maze, player, input_controller, moves, won, goal_placement, game_mode='
                             # Reset explored tiles for fog of war
                             if fog_of_war:
                                 explored_tiles.clear()
-                                vision_range = 5
-                                for dy in range(-vision_range, vision_range + 1):
-                                    for dx in range(-vision_range, vision_range + 1):
-                                        tile_x = player.tile_x + dx
-                                        tile_y = player.tile_y + dy
-                                        if 0 <= tile_x < len(maze[0]) and 0 <= tile_y < len(maze):
-                                            if abs(dx) + abs(dy) <= vision_range:
-                                                explored_tiles.add((tile_x, tile_y))
+                                for dx, dy in VISION_OFFSETS:
+                                    tile_x = player.tile_x + dx
+                                    tile_y = player.tile_y + dy
+                                    if 0 <= tile_x < maze.shape[1] and 0 <= tile_y < maze.shape[0]:
+                                        explored_tiles.add((tile_x, tile_y))
 
                             print(f"→ Starting Level {current_level}")
                         else:
@@ -1250,16 +1440,13 @@ def loop(maze, player, input_controller, moves, won, goal_placement, game_mode='
                     # Start from level 1 on restart
                     maze = generate_progressive_maze(MAZE_WIDTH, MAZE_HEIGHT, goal_placement, 1)
                 else:
-                    maze = generate_maze(MAZE_WIDTH, MAZE_HEIGHT, goal_placement, game_mode, num_checkpoints)
+                    maze = np.asarray(
+                        generate_maze(MAZE_WIDTH, MAZE_HEIGHT, goal_placement, game_mode, num_checkpoints),
+                        dtype=np.uint8)
                 start_x, start_y = find_start_position(maze)
 
-                # Recreate player sprite
-                player_sprite = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
-                pygame.draw.circle(player_sprite, BLUE, (TILE_SIZE // 2, TILE_SIZE // 2), TILE_SIZE // 3)
-                pygame.draw.circle(player_sprite, WHITE, (TILE_SIZE // 2, TILE_SIZE // 2), TILE_SIZE // 3, 2)
-
                 energy_limit = fuel_limit if energy_constraint else None
-                player = Player(start_x, start_y, TILE_SIZE, player_sprite, BLUE, energy_limit)
+                player = Player(start_x, start_y, TILE_SIZE, PLAYER_SPRITE, BLUE, energy_limit)
                 input_controller = InputController(TILE_SIZE)
                 moves = 0
                 won = False
@@ -1284,22 +1471,17 @@ def loop(maze, player, input_controller, moves, won, goal_placement, game_mode='
                     player_collected_checkpoints.clear()
                     ai_collected_checkpoints.clear()
                     # Repopulate with new checkpoints from regenerated maze
-                    for y in range(len(maze)):
-                        for x in range(len(maze[0])):
-                            if maze[y][x] == TERRAIN_CHECKPOINT:
-                                all_checkpoints.add((x, y))
+                    cp_ys, cp_xs = np.where(maze == TERRAIN_CHECKPOINT)
+                    all_checkpoints.update(zip(cp_xs.tolist(), cp_ys.tolist()))
 
                 # Reset fog of war
                 if fog_of_war:
                     explored_tiles.clear()
-                    vision_range = 5
-                    for dy in range(-vision_range, vision_range + 1):
-                        for dx in range(-vision_range, vision_range + 1):
-                            tile_x = start_x + dx
-                            tile_y = start_y + dy
-                            if 0 <= tile_x < len(maze[0]) and 0 <= tile_y < len(maze):
-                                if abs(dx) + abs(dy) <= vision_range:
-                                    explored_tiles.add((tile_x, tile_y))
+                    for dx, dy in VISION_OFFSETS:
+                        tile_x = start_x + dx
+                        tile_y = start_y + dy
+                        if 0 <= tile_x < maze.shape[1] and 0 <= tile_y < maze.shape[0]:
+                            explored_tiles.add((tile_x, tile_y))
 
                 # Recreate AI agents in competitive mode
                 if player_mode == 'competitive':
@@ -1313,14 +1495,10 @@ def loop(maze, player, input_controller, moves, won, goal_placement, game_mode='
 
                     ai_agent = AIAgent(ai_x, ai_y, TILE_SIZE, ai_name, ai_color, energy_limit)
 
-                    # In multi-goal mode, find all checkpoints and initialize AI's checkpoint list
+                    # In multi-goal mode, find all checkpoints and initialize AI's checkpoint set
                     if game_mode == 'multi-goal':
-                        checkpoints = []
-                        for y in range(len(maze)):
-                            for x in range(len(maze[0])):
-                                if maze[y][x] == TERRAIN_CHECKPOINT:
-                                    checkpoints.append((x, y))
-                        ai_agent.remaining_checkpoints = checkpoints.copy()
+                        cp_ys, cp_xs = np.where(maze == TERRAIN_CHECKPOINT)
+                        ai_agent.remaining_checkpoints = set(zip(cp_xs.tolist(), cp_ys.tolist()))
 
                     ai_agent.calculate_path(maze, fog_of_war)
                     ai_agents.append(ai_agent)
@@ -1329,7 +1507,22 @@ def loop(maze, player, input_controller, moves, won, goal_placement, game_mode='
             if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                 run = False  # Exit game loop to return to menu
 
-        pygame.display.flip()
+        # Push the frame: flip fully when large regions may have changed
+        # (fog reveals, path lines, new background, win banner), otherwise
+        # update only the sprite tiles touched this frame plus the UI panel
+        if render_frame:
+            current_rects = drawn_rects
+            path_active = input_controller.pathfinding_active
+            if (fog_of_war or background_rebuilt or path_active
+                    or prev_path_active or won != prev_won):
+                pygame.display.flip()
+            else:
+                pygame.display.update(current_rects + prev_dynamic_rects + [ui_panel_rect])
+            prev_dynamic_rects = current_rects
+            prev_path_active = path_active
+            prev_won = won
+
+    pygame.event.set_allowed(None)
 
 
 if __name__ == "__main__":
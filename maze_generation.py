@@ -23,6 +23,14 @@ TERRAIN_COSTS = {
     TERRAIN_CHECKPOINT: 1
 }
 
+# Dense lookup tables indexed by terrain id, so hot loops can use a plain
+# list index instead of calling get_terrain_cost/is_passable per tile.
+# Covering the full uint8 range (with the same defaults as the old
+# dict.get calls) lets the helper functions below index unconditionally.
+COST_TABLE = [TERRAIN_COSTS.get(t, 1) for t in range(256)]
+PASSABLE_TABLE = [TERRAIN_COSTS.get(t, float('inf')) < float('inf')
+                  for t in range(256)]
+
 
 class MazeGenerator:
     """Generate mazes using recursive backtracking algorithm with terrain types"""
@@ -286,12 +294,12 @@ class MazeGenerator:
 
 def get_terrain_cost(terrain_type):
     """Get the movement cost for a terrain type"""
-    return TERRAIN_COSTS.get(terrain_type, 1)
+    return COST_TABLE[terrain_type]
 
 
 def is_passable(terrain_type):
     """Check if a terrain type is passable"""
-    return TERRAIN_COSTS.get(terrain_type, float('inf')) < float('inf')
+    return PASSABLE_TABLE[terrain_type]
 
 
 def generate_maze(width=25, height=25, goal_placement='corner', game_mode='explore', num_checkpoints=3):
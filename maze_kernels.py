@@ -0,0 +1,52 @@
+"""Compiled helpers for whole-maze scans
+
+Scalar scans over the uint8 maze grid are the kind of loop Numba
+compiles well, so the kernels here are njit-wrapped when numba is
+installed (with cache=True to avoid recompiling between runs) and fall
+back to vectorized numpy otherwise.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+HAVE_NUMBA = njit is not None
+
+
+def _find_marker_scan(maze, marker):
+    height, width = maze.shape
+    for y in range(height):
+        for x in range(width):
+            if maze[y, x] == marker:
+                return x, y
+    return 1, 1
+
+
+if njit is not None:
+    _find_marker_scan = njit(cache=True)(_find_marker_scan)
+
+
+def find_marker(maze, marker):
+    """Return the (x, y) of the first tile equal to marker, or (1, 1)
+
+    The compiled scan stops at the first hit; the numpy fallback scans
+    the whole grid but still runs in C.
+    """
+    if njit is not None:
+        # Cast the marker so every caller hits the same compiled
+        # specialization (a plain int would trigger a second JIT pass)
+        x, y = _find_marker_scan(maze, np.uint8(marker))
+        return int(x), int(y)
+    ys, xs = np.where(maze == marker)
+    if xs.size:
+        return int(xs[0]), int(ys[0])
+    return 1, 1
+
+
+def warmup():
+    """Trigger JIT compilation up front so gameplay never pays for it"""
+    if njit is not None:
+        find_marker(np.zeros((2, 2), dtype=np.uint8), np.uint8(1))
@@ -74,10 +74,12 @@ def load_sprite(filename, size=TILE_SIZE):
     path = os.path.join("sprites", filename)
     try:
         sprite = pygame.image.load(path).convert_alpha()
-        return pygame.transform.scale(sprite, (size, size))
+        # Re-convert after scaling: transform.scale returns a surface
+        # that is not guaranteed to match the display format
+        return pygame.transform.scale(sprite, (size, size)).convert_alpha()
     except pygame.error as e:
         print(f"Warning: Could not load {filename}: {e}")
-        surf = pygame.Surface((size, size))
+        surf = pygame.Surface((size, size)).convert()
         surf.fill((100, 100, 100))
         return surf
 
@@ -430,12 +432,19 @@ def loop(maze, ai_agents, goal_placement, game_mode, num_agents, fog_of_war, ene
 
                 # Move all active agents simultaneously
                 for ai in active_agents[:]:  # Create copy to safely modify list
-                    # Recalculate path
-                    ai.calculate_path(maze, fog_of_war)
+                    # Only replan when the path ran out or was invalidated
+                    if ai.needs_replan():
+                        ai.calculate_path(maze, fog_of_war)
 
                     # Make move
                     moved = ai.make_move(maze)
 
+                    # Update AI vision after moving (for fog of war); with
+                    # replanning now skipped while a path is valid, this is
+                    # the only per-move reveal
+                    if fog_of_war and moved:
+                        ai.update_vision(maze, fog_of_war=fog_of_war)
+
                     # Check if this AI finished
                     if ai.finished and winner is None:
                         winner = ai.name
@@ -0,0 +1,213 @@
+"""Compiled batch kernels for the algorithm comparison dashboard
+
+Each kernel advances one algorithm by up to n_steps over flat numpy state
+(visited/dist/parent arrays indexed by pos = y * width + x) and records
+the explored positions in an output buffer so the visualizer can keep its
+incremental drawing and statistics. Numba is optional: when it is not
+installed the visualizer falls back to its per-step Python methods.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+from maze_generation import TERRAIN_COSTS
+
+HAVE_NUMBA = njit is not None
+
+# Large finite stand-in for infinity so costs fit in int32 arrays
+INF = 2 ** 30
+
+# Terrain costs indexed by terrain id (impassable terrain maps to INF)
+COST_LUT = np.array(
+    [INF if TERRAIN_COSTS.get(t, 1) == float('inf') else TERRAIN_COSTS.get(t, 1)
+     for t in range(256)],
+    dtype=np.int32
+)
+
+
+def bfs_bi_batch(maze, visited_f, parent_f, queue_f, head_f, tail_f,
+                 visited_b, parent_b, queue_b, head_b, tail_b,
+                 cost_lut, n_steps, out_nodes):
+    """Advance bidirectional BFS by up to n_steps pops
+
+    Each step expands one node from the smaller of the two frontiers.
+    Newly discovered positions are written to out_nodes; backward-side
+    entries are offset by the grid size so the caller can tell which
+    parent array they belong to. Returns (head_f, tail_f, head_b, tail_b,
+    n_out, meet_f, meet_b) where the meeting positions are -1 until the
+    frontiers touch.
+    """
+    height = maze.shape[0]
+    width = maze.shape[1]
+    size = height * width
+    n_out = 0
+
+    for _ in range(n_steps):
+        fwd_pending = tail_f - head_f
+        bwd_pending = tail_b - head_b
+        if fwd_pending == 0 and bwd_pending == 0:
+            break
+        forward = bwd_pending == 0 or (fwd_pending != 0
+                                       and fwd_pending <= bwd_pending)
+        if forward:
+            current = queue_f[head_f]
+            head_f += 1
+        else:
+            current = queue_b[head_b]
+            head_b += 1
+
+        x = current % width
+        y = current // width
+        for d in range(4):
+            if d == 0:
+                nx = x
+                ny = y + 1
+            elif d == 1:
+                nx = x + 1
+                ny = y
+            elif d == 2:
+                nx = x
+                ny = y - 1
+            else:
+                nx = x - 1
+                ny = y
+            if nx < 0 or nx >= width or ny < 0 or ny >= height:
+                continue
+            if cost_lut[maze[ny, nx]] >= INF:
+                continue
+            next_pos = ny * width + nx
+            if forward:
+                if visited_f[next_pos]:
+                    continue
+                if visited_b[next_pos]:
+                    return (head_f, tail_f, head_b, tail_b, n_out,
+                            current, next_pos)
+                visited_f[next_pos] = 1
+                parent_f[next_pos] = current
+                queue_f[tail_f] = next_pos
+                tail_f += 1
+                out_nodes[n_out] = next_pos
+            else:
+                if visited_b[next_pos]:
+                    continue
+                if visited_f[next_pos]:
+                    return (head_f, tail_f, head_b, tail_b, n_out,
+                            next_pos, current)
+                visited_b[next_pos] = 1
+                parent_b[next_pos] = current
+                queue_b[tail_b] = next_pos
+                tail_b += 1
+                out_nodes[n_out] = next_pos + size
+            n_out += 1
+
+    return head_f, tail_f, head_b, tail_b, n_out, -1, -1
+
+
+def weighted_batch(maze, settled, dist, parent, heap, heap_len, goal,
+                   cost_lut, use_heuristic, n_steps, out_nodes):
+    """Advance Dijkstra (use_heuristic=False) or A* by up to n_steps pops
+
+    The heap holds (priority << 32) | pos keys; for A* the priority is
+    g + Manhattan distance to the goal, for Dijkstra it is g alone. A pop
+    of an already-settled entry counts as a step, matching the per-step
+    Python methods. Returns (heap, heap_len, n_out, done).
+    """
+    height = maze.shape[0]
+    width = maze.shape[1]
+    gx = goal % width
+    gy = goal // width
+    n_out = 0
+    done = False
+
+    for _ in range(n_steps):
+        if heap_len == 0:
+            break
+
+        # Pop the root: move the last entry up and sift it down
+        key = heap[0]
+        heap_len -= 1
+        last = heap[heap_len]
+        i = 0
+        while True:
+            child = 2 * i + 1
+            if child >= heap_len:
+                break
+            right = child + 1
+            if right < heap_len and heap[right] < heap[child]:
+                child = right
+            if heap[child] < last:
+                heap[i] = heap[child]
+                i = child
+            else:
+                break
+        if heap_len > 0:
+            heap[i] = last
+
+        pos = int(key & 0xFFFFFFFF)
+        if settled[pos]:
+            continue
+        settled[pos] = 1
+        out_nodes[n_out] = pos
+        n_out += 1
+
+        if pos == goal:
+            done = True
+            break
+
+        x = pos % width
+        y = pos // width
+        g = dist[pos]
+        for d in range(4):
+            if d == 0:
+                nx = x
+                ny = y + 1
+            elif d == 1:
+                nx = x + 1
+                ny = y
+            elif d == 2:
+                nx = x
+                ny = y - 1
+            else:
+                nx = x - 1
+                ny = y
+            if nx < 0 or nx >= width or ny < 0 or ny >= height:
+                continue
+            move_cost = cost_lut[maze[ny, nx]]
+            if move_cost >= INF:
+                continue
+            next_pos = ny * width + nx
+            new_cost = g + move_cost
+            if new_cost < dist[next_pos]:
+                dist[next_pos] = new_cost
+                parent[next_pos] = pos
+                priority = new_cost
+                if use_heuristic:
+                    priority += abs(nx - gx) + abs(ny - gy)
+                new_key = (np.int64(priority) << 32) | next_pos
+
+                # Push: grow the heap if full, then sift up
+                if heap_len == heap.shape[0]:
+                    grown = np.empty(heap.shape[0] * 2, dtype=np.int64)
+                    grown[:heap_len] = heap[:heap_len]
+                    heap = grown
+                i = heap_len
+                heap_len += 1
+                while i > 0:
+                    up = (i - 1) // 2
+                    if heap[up] > new_key:
+                        heap[i] = heap[up]
+                        i = up
+                    else:
+                        break
+                heap[i] = new_key
+
+    return heap, heap_len, n_out, done
+
+
+if njit is not None:
+    bfs_bi_batch = njit(cache=True)(bfs_bi_batch)
+    weighted_batch = njit(cache=True)(weighted_batch)
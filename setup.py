@@ -0,0 +1,18 @@
+"""Build script for the optional Cython pathfinding extension
+
+The game runs fine without it; building it gives ai_agent a compiled A*
+inner loop without needing numba:
+
+    pip install cython
+    python setup.py build_ext --inplace
+"""
+
+import numpy as np
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="astar-core",
+    ext_modules=cythonize("astar_core.pyx", language_level=3),
+    include_dirs=[np.get_include()],
+)